@@ -0,0 +1,108 @@
+import os
+import sys
+import shutil
+import argparse
+import subprocess
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.difficulty_store import STORE_PATH, CSV_PATH, SOURCE_FILE, FACTORS, csv_hash
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def build_difficulty_store(csv_path=CSV_PATH, path=STORE_PATH):
+    """
+    Pack final_difficulty_scores.csv into sorted words + one float32 column per
+    factor, with the CSV's hash so a later CSV change is detected on load.
+    """
+    df = pd.read_csv(csv_path, float_precision="round_trip")
+    words = df["Word"].str.upper().to_numpy().astype("S5")
+    sorted_ids = np.argsort(words, kind="stable")
+
+    # Sorted position of each CSV row, so iteration can follow the CSV order
+    order = np.empty(len(words), dtype=np.int32)
+    order[sorted_ids] = np.arange(len(words), dtype=np.int32)
+
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    np.save(os.path.join(tmp_path, "words.npy"), words[sorted_ids])
+    np.save(os.path.join(tmp_path, "order.npy"), order)
+    for factor in FACTORS:
+        np.save(os.path.join(tmp_path, f"{factor}.npy"), df[factor].to_numpy(dtype=np.float32)[sorted_ids])
+    with open(os.path.join(tmp_path, SOURCE_FILE), "w") as f:
+        f.write(csv_hash(csv_path) + "\n")
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+# numpy is imported first: every app entry point already loads it.
+# RSS comes from /proc where available; allocated blocks work everywhere.
+PROBE = """
+import os, sys, time
+import numpy
+sys.path.insert(0, {path!r})
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, AttributeError, ValueError):
+        return -1
+
+rss, blocks = rss_kb(), sys.getallocatedblocks()
+t = time.perf_counter()
+from {module} import difficulty_data
+row = difficulty_data["CRANE"]
+print(time.perf_counter() - t, rss_kb() - rss if rss >= 0 else -1, sys.getallocatedblocks() - blocks)
+"""
+
+
+def _probe(module, path, repeat=5):
+    # Allow .pyc files so warm runs measure the literal without recompiling it
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(module=module, path=path)],
+                             capture_output=True, text=True, check=True, cwd=ROOT, env=env).stdout.split()
+        runs.append((float(out[0]), int(out[1]), int(out[2])))
+    return min(runs)
+
+
+def benchmark(csv_path=CSV_PATH):
+    """Import time and peak RSS of the old dict-literal module vs the columnar store."""
+    df = pd.read_csv(csv_path, float_precision="round_trip")
+    literal = {r["Word"]: {f: r[f] for f in FACTORS} for r in df.to_dict("records")}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "difficulty_literal.py"), "w") as f:
+            f.write(f"difficulty_data = {literal!r}")
+        results = {
+            # First import compiles the literal and writes the .pyc
+            "dict literal (cold)": _probe("difficulty_literal", tmp, repeat=1),
+            "dict literal (.pyc)": _probe("difficulty_literal", tmp),
+            "columnar store": _probe("app.difficulty_data", ROOT),
+        }
+
+    print(f"{'':>22}  {'import+lookup':>14}  {'added RSS':>10}  {'objects':>9}")
+    for name, (seconds, rss_kb, blocks) in results.items():
+        rss = f"{rss_kb / 1024:>7.1f} MB" if rss_kb >= 0 else f"{'n/a':>10}"
+        print(f"{name:>22}  {seconds * 1000:>11.1f} ms  {rss}  {blocks:>9,}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the packed difficulty store from final_difficulty_scores.csv")
+    parser.add_argument("--benchmark", action="store_true", help="Compare import time and memory with the dict literal")
+    args = parser.parse_args()
+
+    build_difficulty_store()
+    print(f"✅ Saved difficulty store to {STORE_PATH}")
+    if args.benchmark:
+        benchmark()
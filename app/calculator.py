@@ -1,29 +1,34 @@
 import os
 import sys
-import pandas as pd
+from functools import lru_cache
+import numpy as np
 
 # Allow relative imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from features.letter_features import compute_lfs, compute_plfs, compute_rlp
-from features.bigram_features import compute_hlt
-from features.shape_features import compute_shape_features
-from features.obscurity_score import compute_os
+from features.letter_features import compute_lfs_batch, compute_plfs_batch, compute_rlp_batch
+from features.bigram_features import compute_hlt, compute_hlt_batch
+from features.obscurity_score import compute_os, compute_os_batch
+from features.ods import compute_ods, compute_expected_guesses
+from features.ods import compute_ods_batch, compute_expected_guesses_batch, round3, builtin_round3
+from features.wordle_logic import encode_words
+from features.oov_wsa import compute_oov_wsa, compute_oov_wsa_batch
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
 
-# Load dictionary and starter words
-with open(os.path.join(DATA_PATH, 'words.txt'), 'r') as f:
-    all_words = [w.strip().upper() for w in f if len(w.strip()) == 5]
-
 starter_words = ["STARE", "CRANE", "SLATE", "AUDIO", "RAISE", "TRACE", "ARISE", "CARTE", "SALET", "REACT", "POINT", "BLUSH", "NYMPH", "DOING", "FIGHT"]
 
-# ✅ Load precomputed WSA values
-true_wsa_df = pd.read_csv(os.path.join(DATA_PATH, "true_wsa_scores.csv"))
-true_wsa_lookup = {
-    row["Word"].upper(): row["WSA"]
-    for _, row in true_wsa_df.iterrows()
-}
+# ✅ Precomputed WSA values, loaded on the first calculation
+@lru_cache(maxsize=None)
+def true_wsa_lookup() -> dict:
+    import pandas as pd
+
+    true_wsa_df = pd.read_csv(os.path.join(DATA_PATH, "true_wsa_scores.csv"))
+    return dict(zip(true_wsa_df["Word"].str.upper(), true_wsa_df["WSA"]))
+
+def is_scorable(word: str) -> bool:
+    return len(word) == 5 and word.isascii() and word.isalpha()
 
 def calculate_difficulty(word: str) -> dict:
     word = word.upper()
@@ -35,21 +40,15 @@ def calculate_difficulty(word: str) -> dict:
     hlt = compute_hlt(word)
     os_score = compute_os(word)
 
-    # Lookup WSA
-    wsa_normalized = round(true_wsa_lookup.get(word, 0.5), 3)  # fallback to 0.5 if missing
+    # Lookup WSA, scoring words outside the dictionary on demand
+    wsa = true_wsa_lookup().get(word)
+    if wsa is None:
+        wsa = compute_oov_wsa(word) if is_scorable(word) else 0.5
+    wsa_normalized = round(wsa, 3)
 
     # Final ODS score
-    ods = round(
-        0.25 * lfs +
-        0.15 * plfs +
-        0.15 * rlp +
-        0.15 * hlt +
-        0.15 * wsa_normalized +
-        0.15 * os_score,
-        3
-    )
-
-    expected_guesses = round(2.5 + ods * 3.5, 3)
+    ods = compute_ods(lfs, plfs, rlp, hlt, wsa_normalized, os_score)
+    expected_guesses = compute_expected_guesses(ods)
 
     return {
         "Word": word,
@@ -62,3 +61,49 @@ def calculate_difficulty(word: str) -> dict:
         "ODS": ods,
         "ExpectedGuesses": expected_guesses
     }
+
+@lru_cache(maxsize=None)
+def true_wsa_series():
+    import pandas as pd
+
+    return pd.Series(true_wsa_lookup(), dtype=float)
+
+def calculate_difficulty_batch(words):
+    """
+    calculate_difficulty for many words at once, as a DataFrame with one row
+    per word in input order. Every factor is computed on arrays and rounded
+    like the scalar path: factors the way round() rounds them there, ODS and
+    ExpectedGuesses with numpy rounding like the stored scores. Raises
+    ValueError if a word is not 5 letters.
+    """
+    import pandas as pd
+
+    words = [w.upper() for w in words]
+    codes = encode_words(words)
+
+    lfs = compute_lfs_batch(codes)
+    plfs = compute_plfs_batch(codes)
+    rlp = compute_rlp_batch(codes)
+    hlt = round3(compute_hlt_batch(words, codes))
+    os_score = compute_os_batch(words)
+
+    wsa = true_wsa_series().reindex(words).to_numpy(copy=True)
+    missing = np.isnan(wsa)
+    if missing.any():
+        wsa[missing] = compute_oov_wsa_batch([w for w, m in zip(words, missing) if m])
+    wsa_normalized = builtin_round3(wsa)
+
+    ods = compute_ods_batch(lfs, plfs, rlp, hlt, wsa_normalized, os_score)
+    expected_guesses = compute_expected_guesses_batch(ods)
+
+    return pd.DataFrame({
+        "Word": words,
+        "LFS": lfs,
+        "PLFS": plfs,
+        "RLP": rlp,
+        "HLT": hlt,
+        "WSA": wsa_normalized,
+        "OS": os_score,
+        "ODS": ods,
+        "ExpectedGuesses": expected_guesses
+    })
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 
 # Automatically resolve the path to the data file
@@ -12,12 +13,30 @@ except FileNotFoundError:
     print("❌ Error: final_difficulty_scores.csv not found.")
     exit(1)
 
+# Indexed store, built once: word -> row id, plus the factor columns as one float matrix
+row_ids = dict(zip(df["Word"], range(len(df))))
+factor_columns = [c for c in df.columns if c != "Word"]
+factor_values = df[factor_columns].to_numpy(dtype=float)
+
 def lookup_difficulty(word: str) -> dict:
     word = word.strip().upper()
-    match = df[df["Word"] == word]
-    if match.empty:
+    i = row_ids.get(word)
+    if i is None:
         return None
-    return match.iloc[0].to_dict()
+    return {"Word": word, **dict(zip(factor_columns, factor_values[i].tolist()))}
+
+def lookup_many(words) -> pd.DataFrame:
+    """
+    Look up a batch of words in one gather. Rows follow the input order;
+    words missing from the database get NaN scores.
+    """
+    words = [w.strip().upper() for w in words]
+    ids = np.fromiter((row_ids.get(w, -1) for w in words), dtype=np.int64, count=len(words))
+    values = factor_values[np.maximum(ids, 0)]
+    values[ids < 0] = np.nan
+    result = pd.DataFrame(values, columns=factor_columns)
+    result.insert(0, "Word", words)
+    return result
 
 if __name__ == "__main__":
     word = input("🔤 Enter a 5-letter Wordle word: ").strip()
@@ -1,12 +1,123 @@
 import argparse
-from app.calculator import calculate_difficulty
+import csv
+import io
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from app.calculator import calculate_difficulty, calculate_difficulty_batch
 
-parser = argparse.ArgumentParser(description="Wordle Difficulty Calculator")
-parser.add_argument("word", type=str, help="A 5-letter word to evaluate")
+COLUMNS = ["Word", "LFS", "PLFS", "RLP", "HLT", "WSA", "OS", "ODS", "ExpectedGuesses"]
+# Words are validated ASCII letters and scores are floats, whose repr is valid JSON,
+# so a row template gives the same output as json.dumps at a fraction of the cost
+NDJSON_ROW = "{" + ", ".join(f'"{c}": ' + ('"%s"' if c == "Word" else "%r") for c in COLUMNS) + "}\n"
 
-args = parser.parse_args()
-result = calculate_difficulty(args.word)
 
-print("\n📊 Difficulty Analysis:")
-for k, v in result.items():
-    print(f"{k:>16}: {v}")
+class InvalidWordError(ValueError):
+    """An input line that is not a 5-letter word."""
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def read_batches(lines, batch_size, skip_invalid):
+    """
+    Yield lists of up to batch_size upper-case words from an iterable of lines.
+    Blank lines are ignored; other non-5-letter lines are skipped or raise InvalidWordError.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    batch = []
+    for n, line in enumerate(lines, 1):
+        word = line.strip().upper()
+        if not word:
+            continue
+        if len(word) != 5 or not (word.isascii() and word.isalpha()):
+            if skip_invalid:
+                continue
+            raise InvalidWordError(f"line {n}: {line.strip()!r} is not a 5-letter word")
+        batch.append(word)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def score_batch(words, fmt):
+    """Score one batch and render it as NDJSON or CSV lines (no header)."""
+    df = calculate_difficulty_batch(words)
+    if fmt == "ndjson":
+        return "".join(NDJSON_ROW % tuple(row) for row in df[COLUMNS].values.tolist())
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerows(df[COLUMNS].values.tolist())
+    return out.getvalue()
+
+
+def run_bulk(lines, out, fmt="ndjson", batch_size=1000, jobs=1, skip_invalid=False):
+    """
+    Stream words from lines to out. Batches are written in input order as soon as
+    they are scored; at most 2 * jobs batches are in flight, so memory stays flat.
+    """
+    if fmt == "csv":
+        out.write(",".join(COLUMNS) + "\n")
+    batches = read_batches(lines, batch_size, skip_invalid)
+    if jobs <= 1:
+        for words in batches:
+            out.write(score_batch(words, fmt))
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for words in batches:
+            pending.append(pool.submit(score_batch, words, fmt))
+            if len(pending) >= 2 * jobs:
+                out.write(pending.popleft().result())
+        while pending:
+            out.write(pending.popleft().result())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wordle Difficulty Calculator")
+    parser.add_argument("word", type=str, nargs="?", help="A 5-letter word to evaluate")
+    parser.add_argument("--input", "-i", metavar="FILE",
+                        help="Bulk mode: score one word per line from FILE ('-' for stdin)")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="Bulk output format")
+    parser.add_argument("--batch-size", type=positive_int, default=1000, help="Words scored per batch in bulk mode")
+    parser.add_argument("--jobs", type=positive_int, default=1, help="Worker processes for bulk mode (default: 1)")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="Skip lines that are not 5-letter words instead of stopping")
+    args = parser.parse_args()
+
+    if args.input is None and args.word is None:
+        if sys.stdin.isatty():
+            parser.error("give a word, or pipe words in / use --input for bulk mode")
+        args.input = "-"
+
+    if args.input is None:
+        result = calculate_difficulty(args.word)
+
+        print("\n📊 Difficulty Analysis:")
+        for k, v in result.items():
+            print(f"{k:>16}: {v}")
+        return
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r")
+    try:
+        run_bulk(source, sys.stdout, args.format, args.batch_size, args.jobs, args.skip_invalid)
+    except InvalidWordError as e:
+        sys.exit(f"❌ {e} (use --skip-invalid to ignore such lines)")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
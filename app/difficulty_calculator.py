@@ -4,11 +4,21 @@ import tkinter as tk
 from tkinter import messagebox
 import pandas as pd
 import webbrowser
-from scipy.stats import percentileofscore
 from random import choice, sample
 import re
 from tkinter import ttk
 
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.percentiles import PercentileService
+from app.neighbors import ScoreIndex
+from app.morph_graph import load_morph_graph
+from features.constraints import fits_clues
+from app.puzzle_bank import open_puzzle_bank
+from app.letter_index import LetterIndex
+from app.fake_words import FakeWordGenerator, FakeWordPool
+
 # ---------- Resource Path for PyInstaller bundling ---------- #
 def resource_path(relative_path):
     if hasattr(sys, '_MEIPASS'):
@@ -45,6 +55,13 @@ actual_ods_scores = [
     word_data[w]["ODS"] for w in actual_word_list if w in word_data
 ]
 
+percentiles = PercentileService()
+percentiles.register("answers", actual_ods_scores)
+
+# Past answers sorted by ODS, for "words with similar difficulty"
+similar_words_pool = [w for w in actual_word_list if w in word_data]
+similar_index = ScoreIndex(similar_words_pool, [word_data[w]["ODS"] for w in similar_words_pool])
+
 # ---------- Tkinter GUI Setup ---------- #
 root = tk.Tk()
 root.title("Wordle Difficulty Calculator")
@@ -131,12 +148,10 @@ def check_word():
     data = word_data[word]
     expected_label.config(text=f"Expected Guesses: {data['ExpectedGuesses']:.2f}")
 
-    percentile = percentileofscore(actual_ods_scores, data["ODS"])
+    percentile = percentiles.percentile("answers", data["ODS"])
     percentile_label.config(text=f"This word is harder than {percentile:.1f}% of Wordles")
 
-    similar_candidates = [(w, abs(word_data[w]["ODS"] - data["ODS"])) for w in actual_word_list if w != word and w in word_data]
-    similar_sorted = sorted(similar_candidates, key=lambda x: x[1])[:5]
-    similar_words = ", ".join(w for w, _ in similar_sorted)
+    similar_words = ", ".join(w for w, _ in similar_index.nearest(data["ODS"], 5, exclude=word))
     similar_label.config(text=f"Words with similar difficulty: {similar_words}")
 
     detailed_result = f"WORD:  {word.upper()}\n\n"
@@ -205,7 +220,7 @@ def submit_guess():
     if word not in word_data:
         game_result_label.config(text="Word not found in dataset.")
         return
-    actual_percentile = percentileofscore(actual_ods_scores, word_data[word]["ODS"])
+    actual_percentile = percentiles.percentile("answers", word_data[word]["ODS"])
     diff = abs(actual_percentile - guess)
     score["total"] += 1
     if diff <= 10:
@@ -433,29 +448,13 @@ fakeout_score_label.pack()
 # Prepare real obscure words
 real_obscure_words = [w for w in word_data if word_data[w]["OS"] == 1.0]
 
-# Train 2-letter n-gram model on those
-from collections import defaultdict
+# Train 2-letter n-gram model on those, compiled so every draw completes a word
 import random
 
-ngram_counts = defaultdict(list)
-for word in real_obscure_words:
-    for i in range(len(word)-2):
-        prefix = word[i:i+2]
-        next_letter = word[i+2]
-        ngram_counts[prefix].append(next_letter)
+fake_word_pool = FakeWordPool(FakeWordGenerator(real_obscure_words, word_data))
 
 def generate_fake_word():
-    while True:
-        word = random.choice(real_obscure_words)
-        base = word[:2]
-        result = base
-        while len(result) < 5:
-            options = ngram_counts.get(result[-2:], [])
-            if not options:
-                break
-            result += random.choice(options)
-        if result not in word_data and len(result) == 5:
-            return result.lower()
+    return fake_word_pool.draw()
 
 # Game logic
 fakeout_words = []
@@ -667,20 +666,22 @@ builder_high_score = 0
 builder_timer_id = None
 builder_time_left = 60
 builder_word_set = set(df['Word'].tolist())
+builder_index = LetterIndex(w for w in builder_word_set if len(w) == 5)
 current_valid_words = []
+BUILDER_MIN_WORDS = 5
 
 def generate_letter_pool():
+    # Pools are built from indexed words, so every round has at least BUILDER_MIN_WORDS answers
+    pool = builder_index.generate_pool(random, min_words=BUILDER_MIN_WORDS)
+    if pool is not None:
+        return pool
     vowels = 'aeiou'
     all_letters = 'abcdefghijklmnopqrstuvwxyz'
     pool = sample(vowels, 2) + sample(all_letters, 6)
     return sample(pool, 8)
 
 def find_valid_words():
-    valid = []
-    for word in builder_word_set:
-        if len(word) == 5 and all(word.count(c) <= builder_letters.count(c) for c in set(word)):
-            valid.append(word)
-    return valid
+    return builder_index.formable(builder_letters)
 
 def start_builder_round():
     global builder_letters, builder_used_words, builder_score, builder_timer_id, builder_time_left, current_valid_words
@@ -741,7 +742,7 @@ def check_builder_word():
         builder_feedback.config(text="❌ Not in word list!", fg="#ff7675")
         return
 
-    if all(word.count(c) <= builder_letters.count(c) for c in set(word)):
+    if builder_index.can_form(word, builder_letters):
         builder_used_words.add(word)
         builder_score += 1
         builder_feedback.config(text="✅ Good word!", fg="#00cec9")
@@ -828,7 +829,8 @@ def new_morph_challenge():
 
 def check_morph_attempt():
     guess_path = [morph_path[0]] + [e.get().strip().lower() for e in morph_entries] + [morph_path[-1]]
-    if guess_path == morph_path:
+    # Any chain of one-letter changes through real words counts, not just the stored one
+    if guess_path == morph_path or load_morph_graph().is_chain(guess_path):
         result = "✅ Correct! You solved the morph chain!"
         color = "#00b894"
     else:
@@ -857,16 +859,22 @@ add_github_link(word_morph_tab)
 import json
 
 GRID_PATH = resource_path(os.path.join("data", "grid_puzzles.json"))
-with open(GRID_PATH, 'r') as f:
-    raw_grid_puzzles = json.load(f)
-
-# Filter to only include puzzles whose solution has OS < 0.5
-grid_puzzles = [
-    p for p in raw_grid_puzzles
-    if p['solution'] in word_data and word_data[p['solution']]['OS'] < 0.5
-]
-
-random.shuffle(grid_puzzles)
+grid_bank = open_puzzle_bank()
+if grid_bank is not None:
+    # Built bank: only the index is read here, puzzles load one at a time
+    grid_puzzles = grid_bank.view(grid_bank.ids(max_os=0.5))
+else:
+    with open(GRID_PATH, 'r') as f:
+        raw_grid_puzzles = json.load(f)
+
+    # Filter to only include puzzles whose solution has OS < 0.5
+    grid_puzzles = [
+        p for p in raw_grid_puzzles
+        if p['solution'] in word_data and word_data[p['solution']]['OS'] < 0.5
+    ]
+
+grid_order = list(range(len(grid_puzzles)))
+random.shuffle(grid_order)
 grid_index = [0]
 grid_score = {"solved": 0, "total": 0}
 timer_id = [None]
@@ -899,7 +907,7 @@ def render_grid_puzzle():
     if timer_id[0]:
         root.after_cancel(timer_id[0])
 
-    puzzle = grid_puzzles[grid_index[0]]
+    puzzle = grid_puzzles[grid_order[grid_index[0]]]
     for guess, feedback in puzzle['guesses'][:-1]:
         row = tk.Frame(grid_frame, bg="#1e272e")
         row.pack(pady=2)
@@ -926,7 +934,8 @@ def render_grid_puzzle():
         solution = puzzle['solution']
         grid_score["total"] += 1
 
-        if user_guess == solution:
+        # Any word that would have produced every clue row is a valid answer
+        if user_guess == solution or fits_clues(user_guess, puzzle['guesses'][:-1]):
             grid_score["solved"] += 1
             feedback_label.config(text="✅ Correct!", fg="#2ecc71")
         else:
@@ -936,7 +945,7 @@ def render_grid_puzzle():
         grid_index[0] += 1
         if grid_index[0] >= len(grid_puzzles):
             grid_index[0] = 0
-            random.shuffle(grid_puzzles)
+            random.shuffle(grid_order)
 
         root.after(2500, render_grid_puzzle)
 
@@ -947,7 +956,7 @@ def render_grid_puzzle():
         grid_index[0] += 1
         if grid_index[0] >= len(grid_puzzles):
             grid_index[0] = 0
-            random.shuffle(grid_puzzles)
+            random.shuffle(grid_order)
         root.after(2500, render_grid_puzzle)
 
     def countdown(t=30):
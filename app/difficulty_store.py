@@ -0,0 +1,108 @@
+import os
+import hashlib
+from collections.abc import Mapping
+import numpy as np
+
+STORE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'difficulty_store')
+CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'final_difficulty_scores.csv')
+SOURCE_FILE = "source.txt"
+FACTORS = ["LFS", "PLFS", "RLP", "HLT", "WSA", "OS", "ODS", "ExpectedGuesses"]
+
+
+def csv_hash(csv_path=CSV_PATH) -> str:
+    """SHA-256 of the scores CSV the store was packed from."""
+    with open(csv_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def stored_hash(path=STORE_PATH):
+    try:
+        with open(os.path.join(path, SOURCE_FILE), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class DifficultyStore(Mapping):
+    """
+    Read-only word -> {factor: score} mapping over the packed columnar store:
+    a sorted S5 word array, one float32 column per factor, and the original
+    CSV row order for iteration. Columns are memory-mapped and opened on first use.
+    If the scores CSV is present and no longer matches the hash the store was
+    built from, the store is rebuilt first, so it never disagrees with the CSV.
+    """
+
+    def __init__(self, path=STORE_PATH, csv_path=CSV_PATH):
+        self.path = path
+        self.csv_path = csv_path
+        self._words = None
+
+    def _load(self):
+        if os.path.exists(self.csv_path) and stored_hash(self.path) != csv_hash(self.csv_path):
+            from app.build_difficulty_store import build_difficulty_store
+
+            build_difficulty_store(self.csv_path, self.path)
+
+        def load(name):
+            return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+        self._columns = {f: load(f) for f in FACTORS}
+        self._order = load("order")
+        self._words = load("words")
+
+    @property
+    def words(self) -> np.ndarray:
+        if self._words is None:
+            self._load()
+        return self._words
+
+    @property
+    def order(self) -> np.ndarray:
+        """Sorted-array position of each word, in the original CSV order."""
+        if self._words is None:
+            self._load()
+        return self._order
+
+    def column(self, factor: str) -> np.ndarray:
+        """float32 scores for a factor, aligned with the sorted word array."""
+        if self._words is None:
+            self._load()
+        return self._columns[factor]
+
+    def row_id(self, word: str) -> int:
+        """Position of word in the sorted word array, or -1 if it is not stored."""
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        words = self.words
+        if len(key) > words.dtype.itemsize:
+            return -1
+        i = int(np.searchsorted(words, key))
+        if i < len(words) and words[i] == key:
+            return i
+        return -1
+
+    def row(self, i: int) -> dict:
+        # Scores are stored to 3 decimals, so rounding restores the exact CSV values
+        return {f: round(float(self.column(f)[i]), 3) for f in FACTORS}
+
+    def __getitem__(self, word):
+        i = self.row_id(word) if isinstance(word, str) else -1
+        if i < 0:
+            raise KeyError(word)
+        return self.row(i)
+
+    def __contains__(self, word):
+        return isinstance(word, str) and self.row_id(word) >= 0
+
+    def __iter__(self):
+        words = self.words
+        return (words[i].decode() for i in self.order)
+
+    def __len__(self):
+        return len(self.words)
+
+
+def load_difficulty_store(path=STORE_PATH, csv_path=CSV_PATH) -> DifficultyStore:
+    return DifficultyStore(path, csv_path)
@@ -0,0 +1,114 @@
+import numpy as np
+
+WORD_LENGTH = 5
+
+
+def _encode(words) -> np.ndarray:
+    letters = np.frombuffer("".join(words).lower().encode("ascii"), dtype=np.uint8)
+    # intp, so state ids (first * 26 + second) do not wrap around
+    return letters.reshape(-1, WORD_LENGTH).astype(np.intp) - ord("a")
+
+
+class FakeWordGenerator:
+    """
+    Trigram Markov model over letters, compiled into cumulative-probability
+    arrays. A state is the last two letters (26 * 26 of them). Transitions
+    are restricted to states that can still reach five letters, so every
+    sampled word completes and a whole batch is drawn with array ops.
+    """
+
+    def __init__(self, training_words, real_words=()):
+        codes = _encode([w for w in training_words if len(w) == WORD_LENGTH])
+        self.real_words = {w.lower() for w in real_words}
+
+        # Raw counts: how words start, and which letter follows each two-letter state
+        self.start_counts = np.bincount(codes[:, 0] * 26 + codes[:, 1], minlength=676).astype(np.float64)
+        self.counts = np.zeros((676, 26), dtype=np.float64)
+        for i in range(WORD_LENGTH - 2):
+            np.add.at(self.counts, (codes[:, i] * 26 + codes[:, i + 1], codes[:, i + 2]), 1)
+
+        # viable[k][s]: state s can be extended by k more letters
+        next_state = (np.arange(676) % 26)[:, None] * 26 + np.arange(26)[None, :]
+        viable = [np.ones(676, dtype=bool)]
+        for _ in range(WORD_LENGTH - 2):
+            viable.append(((self.counts > 0) & viable[-1][next_state]).any(axis=1))
+
+        # cumulative[k]: transition table used when k letters are still missing
+        self.next_state = next_state
+        self.cumulative = {}
+        for k in range(1, WORD_LENGTH - 1):
+            weights = np.where(viable[k - 1][next_state], self.counts, 0.0)
+            self.cumulative[k] = np.cumsum(weights, axis=1)
+        start_weights = np.where(viable[WORD_LENGTH - 2], self.start_counts, 0.0)
+        self.start_cumulative = np.cumsum(start_weights)
+
+        # Log-probabilities under the unrestricted model, for plausibility scores
+        with np.errstate(divide="ignore"):
+            self.log_start = np.log(self.start_counts / self.start_counts.sum())
+            self.log_next = np.log(self.counts / np.maximum(self.counts.sum(axis=1, keepdims=True), 1))
+
+    def sample_codes(self, n: int, rng) -> np.ndarray:
+        """(n, 5) letter codes, each drawn from the compiled tables."""
+        out = np.empty((n, WORD_LENGTH), dtype=np.uint8)
+        u = rng.random(n) * self.start_cumulative[-1]
+        state = np.searchsorted(self.start_cumulative, u, side="right")
+        out[:, 0], out[:, 1] = state // 26, state % 26
+        for i in range(2, WORD_LENGTH):
+            cumulative = self.cumulative[WORD_LENGTH - i][state]
+            u = rng.random(n) * cumulative[:, -1]
+            letter = (cumulative <= u[:, None]).sum(axis=1)
+            out[:, i] = letter
+            state = self.next_state[state, letter]
+        return out
+
+    def plausibility(self, codes) -> np.ndarray:
+        """Mean log-probability per letter transition under the trigram model (higher = more word-like)."""
+        codes = np.asarray(codes, dtype=np.intp)
+        state = codes[:, 0] * 26 + codes[:, 1]
+        total = self.log_start[state]
+        for i in range(2, WORD_LENGTH):
+            total = total + self.log_next[state, codes[:, i]]
+            state = self.next_state[state, codes[:, i]]
+        return total / (WORD_LENGTH - 1)
+
+    def generate(self, n: int, rng) -> list:
+        """
+        Up to n distinct fake words with their plausibility, most plausible
+        first. Real words are dropped with a set lookup.
+        """
+        codes = self.sample_codes(n, rng)
+        words = (codes + ord("a")).tobytes().decode("ascii")
+        words = [words[i:i + WORD_LENGTH] for i in range(0, len(words), WORD_LENGTH)]
+        scores = self.plausibility(codes)
+        seen = set()
+        fakes = []
+        for i in np.argsort(-scores, kind="stable"):
+            w = words[i]
+            if w not in self.real_words and w not in seen:
+                seen.add(w)
+                fakes.append((w, float(scores[i])))
+        return fakes
+
+
+class FakeWordPool:
+    """
+    Prefilled fake words for the game: each refill generates a batch, keeps
+    the most plausible `keep` share and shuffles it, so draw() is a pop.
+    """
+
+    def __init__(self, generator, batch=2000, keep=0.5, seed=None):
+        self.generator = generator
+        self.batch = batch
+        self.keep = keep
+        self.rng = np.random.default_rng(seed)
+        self.words = []
+
+    def refill(self):
+        fakes = self.generator.generate(self.batch, self.rng)
+        self.words = [w for w, _ in fakes[:max(1, int(len(fakes) * self.keep))]]
+        self.rng.shuffle(self.words)
+
+    def draw(self) -> str:
+        if not self.words:
+            self.refill()
+        return self.words.pop()
@@ -1,80 +1,178 @@
+import os
+import re
+import sys
 import random
 import json
-from collections import Counter
-
-# Load word list from final_difficulty_scores.csv
-with open("data/final_difficulty_scores.csv") as f:
-    rows = [line.strip().split(",") for line in f.readlines()]
-    header = rows[0]
-    all_rows = rows[1:]
-    word_list = [row[0].lower() for row in all_rows if len(row[0]) == 5]
-    word_os = {row[0].lower(): float(row[6]) for row in all_rows if len(row) > 6 and row[6]}
-
-# Use full dictionary from CSV (not actual_words.txt)
-dictionary = set(word_list)
-
-# Optional: load actual_words just to help diversify guesses
-with open("data/actual_words.txt") as f:
-    actual_words = [w.strip().lower() for w in f if len(w.strip()) == 5]
-
-# Debug: Show some low OS words
-low_os_words = [w for w in word_list if word_os.get(w, 1.0) < 0.5]
-print(f"Words with OS < 0.5: {len(low_os_words)}")
-print("Examples:", low_os_words[:10])
-
-# Candidate puzzle solutions
-candidate_solutions = [w for w in word_list if word_os.get(w, 1.0) < 0.9]
-print(f"Candidate solutions (OS < 0.9): {len(candidate_solutions)}")
-
-# Wordle feedback simulation
-def get_feedback(solution, guess):
-    feedback = ['B'] * 5
-    s_count = Counter(solution)
-    for i in range(5):
-        if guess[i] == solution[i]:
-            feedback[i] = 'G'
-            s_count[guess[i]] -= 1
-    for i in range(5):
-        if feedback[i] == 'B' and s_count[guess[i]] > 0:
-            feedback[i] = 'Y'
-            s_count[guess[i]] -= 1
-    return ''.join(feedback)
-
-def matches(word, guess, feedback):
-    return get_feedback(word, guess) == feedback
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.pattern_matrix import load_pattern_matrix
+from features.constraints import ConstraintEngine
+from app.puzzle_bank import append_puzzles, open_puzzle_bank, BANK_FILE, INDEX_FILE, CLUE_ROWS
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+SCORES_PATH = os.path.join(DATA_PATH, "final_difficulty_scores.csv")
+ACTUAL_WORDS_PATH = os.path.join(DATA_PATH, "actual_words.txt")
+JSON_PATH = os.path.join(DATA_PATH, "grid_puzzles.json")
 
 STARTERS = ["slate", "crane", "stare", "arise", "trace", "reast", "glint", "blame", "pride"]
 
-puzzles = []
-random.shuffle(candidate_solutions)
 
-for target in candidate_solutions:
+def load_words(max_os=0.9):
+    """(dictionary, OS by word, candidate solutions with OS < max_os, guess pool)."""
+    # Load word list from final_difficulty_scores.csv
+    with open(SCORES_PATH) as f:
+        rows = [line.strip().split(",") for line in f.readlines()]
+        all_rows = rows[1:]
+        word_list = [row[0].lower() for row in all_rows if len(row[0]) == 5]
+        word_os = {row[0].lower(): float(row[6]) for row in all_rows if len(row) > 6 and row[6]}
+
+    # Optional: load actual_words just to help diversify guesses (the file is one long line)
+    with open(ACTUAL_WORDS_PATH) as f:
+        actual_words = re.findall(r"\b[a-z]{5}\b", f.read().lower())
+
+    candidates = [w for w in word_list if word_os.get(w, 1.0) < max_os]
+    return sorted(set(word_list)), word_os, candidates, STARTERS + actual_words
+
+
+# Per-process state, set up once by _init_worker
+_state = {}
+
+
+def _init_worker(max_os):
+    dictionary, word_os, candidates, guess_pool = load_words(max_os)
+    _state.update(
+        engine=ConstraintEngine(load_pattern_matrix(), dictionary),
+        word_os=word_os, candidates=candidates, guess_pool=guess_pool,
+    )
+
+
+def make_puzzle(target, rng):
+    """A puzzle for target whose clue rows leave it as the only answer, or None."""
+    engine, guess_pool = _state["engine"], _state["guess_pool"]
     used = set()
     guesses = []
     attempts = 0
-
-    while len(guesses) < 4 and attempts < 100:
-        guess = random.choice(STARTERS + actual_words)
+    while len(guesses) < CLUE_ROWS and attempts < 100:
+        guess = rng.choice(guess_pool)
+        attempts += 1
         if guess in used or guess == target:
-            attempts += 1
             continue
-        fb = get_feedback(target, guess)
-        guesses.append([guess, fb])
+        guesses.append([guess, engine.feedback(guess, target)])
         used.add(guess)
-        attempts += 1
-
-    guesses.append([target, "GGGGG"])
-
-    # Check if it's a uniquely solvable path
-    compatible = [w for w in dictionary if all(matches(w, g, f) for g, f in guesses)]
-    if len(compatible) == 1:
-        puzzles.append({"solution": target, "guesses": guesses})
-
-    if len(puzzles) >= 200:
-        break
-
-# Save to file
-with open("data/grid_puzzles.json", "w") as f:
-    json.dump(puzzles, f, indent=2)
 
-print(f"✅ Generated {len(puzzles)} unique puzzles.")
+    # The clue rows alone must pin down the target (the final GGGGG row
+    # would make any puzzle look unique)
+    compatible = engine.narrowing(guesses)
+    if compatible[-1] != 1:
+        return None
+    return {
+        "solution": target,
+        "guesses": guesses + [[target, "GGGGG"]],
+        "os": _state["word_os"].get(target, 1.0),
+        "compatible": compatible,
+    }
+
+
+def generate_chunk(seed, chunk, size):
+    """
+    Up to `size` attempts with an RNG seeded from (seed, chunk), so a chunk's
+    puzzles do not depend on which worker ran it or how many there are.
+    """
+    rng = random.Random(f"{seed}:{chunk}")
+    puzzles = []
+    for _ in range(size):
+        puzzle = make_puzzle(rng.choice(_state["candidates"]), rng)
+        if puzzle is not None:
+            puzzles.append(puzzle)
+    return puzzles
+
+
+def puzzle_key(puzzle) -> tuple:
+    return puzzle["solution"], tuple(g for g, _ in puzzle["guesses"])
+
+
+def existing_keys(path=BANK_FILE, index_path=INDEX_FILE) -> set:
+    """Keys of the puzzles already in the bank, so appending never duplicates one."""
+    bank = open_puzzle_bank(path, index_path)
+    if bank is None:
+        return set()
+    try:
+        return {puzzle_key(bank[i]) for i in range(len(bank))}
+    finally:
+        bank.close()
+
+
+def build_bank(count, seed, jobs=1, chunk_size=2000, max_os=0.9, path=BANK_FILE, index_path=INDEX_FILE):
+    """
+    Append `count` puzzles to the bank that it does not already hold. Chunks
+    are written in chunk order, so the same seed gives the same bank for any
+    number of jobs.
+    """
+    seen = existing_keys(path, index_path)
+    added = 0
+
+    def take(puzzles):
+        nonlocal added
+        fresh = []
+        for p in puzzles:
+            key = puzzle_key(p)
+            if key not in seen and added + len(fresh) < count:
+                seen.add(key)
+                fresh.append(p)
+        added += append_puzzles(fresh, path, index_path)
+
+    if jobs <= 1:
+        _init_worker(max_os)
+        chunk = 0
+        while added < count:
+            take(generate_chunk(seed, chunk, chunk_size))
+            chunk += 1
+        return added
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(max_os,)) as pool:
+        pending = deque()
+        chunk = 0
+        while added < count:
+            while len(pending) < 2 * jobs:
+                pending.append(pool.submit(generate_chunk, seed, chunk, chunk_size))
+                chunk += 1
+            take(pending.popleft().result())
+        for future in pending:
+            future.cancel()
+    return added
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate Reverse Wordle puzzles into the puzzle bank")
+    parser.add_argument("--count", type=int, default=200, help="Distinct puzzles to add")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output (random if omitted)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Attempts per worker task")
+    parser.add_argument("--max-os", type=float, default=0.9, help="Only solutions with OS below this")
+    parser.add_argument("--fresh", action="store_true", help="Start a new bank instead of appending")
+    parser.add_argument("--json", action="store_true",
+                        help=f"Also write the bank's puzzles (without metadata) to {JSON_PATH}")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    if args.fresh:
+        for p in (BANK_FILE, INDEX_FILE):
+            if os.path.exists(p):
+                os.remove(p)
+
+    added = build_bank(args.count, seed, args.jobs, args.chunk_size, args.max_os)
+    print(f"✅ Added {added} unique puzzles (seed {seed}) to {BANK_FILE}")
+
+    if args.json:
+        from app.puzzle_bank import PuzzleBank
+
+        bank = PuzzleBank()
+        puzzles = [{"solution": p["solution"], "guesses": p["guesses"]} for p in (bank[i] for i in range(len(bank)))]
+        with open(JSON_PATH, "w") as f:
+            json.dump(puzzles, f, indent=2)
+        print(f"✅ Saved {len(puzzles)} puzzles to {JSON_PATH}")
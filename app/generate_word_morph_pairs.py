@@ -1,83 +1,65 @@
-import pandas as pd
-import random
-import json
-from collections import defaultdict, deque
 import os
+import sys
+import json
+import random
+import argparse
 
-# Load the dataset
-DATA_PATH = os.path.join("data", "final_difficulty_scores.csv")
-
-df = pd.read_csv(DATA_PATH)
-df['Word'] = df['Word'].str.lower()
-
-# Filter words with OS < 0.5
-filtered_words = set(df[df["OS"] < 0.5]["Word"])
-
-# Build adjacency graph (words that differ by one letter)
-def build_graph(words):
-    graph = defaultdict(set)
-    buckets = defaultdict(list)
-
-    for word in words:
-        for i in range(5):
-            pattern = word[:i] + "_" + word[i+1:]
-            buckets[pattern].append(word)
-
-    for group in buckets.values():
-        for i in range(len(group)):
-            for j in range(i+1, len(group)):
-                w1, w2 = group[i], group[j]
-                graph[w1].add(w2)
-                graph[w2].add(w1)
-
-    return graph
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# BFS to find the shortest path from start to end
-def bfs_path(start, end, graph):
-    visited = {start}
-    queue = deque([[start]])
+from app.morph_distances import load_morph_distances, BANDS
 
-    while queue:
-        path = queue.popleft()
-        current = path[-1]
-        if current == end:
-            return path
-        for neighbor in graph[current]:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(path + [neighbor])
-    return None
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'morph_pairs.json')
+META_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'morph_pairs_meta.json')
 
 # Generate valid morph chains
-def generate_morph_pairs(words, graph, count=100, min_len=4, max_len=10):
-    words_list = list(words)
-    random.shuffle(words_list)
+def generate_morph_pairs(distances, count=100, min_len=4, max_len=10, seed=None, band=None):
+    """
+    Shortest chains with a length (in words) drawn uniformly from [min_len, max_len].
+    Each chain is sampled at its exact length from the distance matrix, and
+    optionally inside a difficulty band from the stored route counts, so no
+    search is wasted on pairs that turn out too short, too long or off-band.
+    """
+    rng = random.Random(seed)
     pairs = []
     seen = set()
 
     attempts = 0
     while len(pairs) < count and attempts < 5000:
-        w1, w2 = random.sample(words_list, 2)
-        key = tuple(sorted((w1, w2)))
+        attempts += 1
+        path = distances.sample_chain(rng.randint(min_len, max_len), rng, band=band)
+        if path is None:
+            continue
+        key = tuple(sorted((path[0], path[-1])))
         if key in seen:
             continue
         seen.add(key)
-
-        path = bfs_path(w1, w2, graph)
-        if path and min_len <= len(path) <= max_len:
-            pairs.append(path)
-        attempts += 1
+        pairs.append(path)
 
     return pairs
 
+# Routes, branching and difficulty for each chain, in the same order
+def morph_pairs_meta(distances, pairs):
+    return [distances.chain_meta(path) for path in pairs]
+
 # Main execution
 if __name__ == "__main__":
-    graph = build_graph(filtered_words)
-    morph_pairs = generate_morph_pairs(filtered_words, graph, count=100, min_len=4, max_len=10)
+    parser = argparse.ArgumentParser(description="Generate Word Morph chains")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--min-len", type=int, default=4, help="Shortest chain, in words")
+    parser.add_argument("--max-len", type=int, default=10, help="Longest chain, in words")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument("--band", choices=list(BANDS), default=None, help="Only chains in this difficulty band")
+    args = parser.parse_args()
+
+    distances = load_morph_distances()
+    morph_pairs = generate_morph_pairs(distances, args.count, args.min_len, args.max_len, args.seed, args.band)
 
     # Save to file
-    output_path = os.path.join("data", "morph_pairs.json")
-    with open(output_path, "w") as f:
+    with open(OUTPUT_PATH, "w") as f:
         json.dump(morph_pairs, f, indent=2)
+    with open(META_PATH, "w") as f:
+        json.dump(morph_pairs_meta(distances, morph_pairs), f, indent=2)
 
-    print(f"✅ Generated {len(morph_pairs)} word morph chains and saved to {output_path}")
+    print(f"✅ Generated {len(morph_pairs)} word morph chains and saved to {OUTPUT_PATH}")
+    print(f"✅ Saved routes, branching and difficulty bands to {META_PATH}")
@@ -0,0 +1,71 @@
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+VOWELS = np.array([c in "aeiou" for c in ALPHABET])
+
+
+def letter_counts(letters) -> np.ndarray:
+    """26-letter count vector (uint8) of a word or a list of letters."""
+    codes = np.frombuffer("".join(letters).lower().encode("ascii"), dtype=np.uint8) - ord("a")
+    return np.bincount(codes, minlength=26).astype(np.uint8)
+
+
+class LetterIndex:
+    """
+    Every word's letter multiset as an (N, 26) uint8 count matrix, so the
+    words formable from a pool of letters are one vectorized comparison.
+    """
+
+    def __init__(self, words):
+        self.words = sorted(w.lower() for w in words)
+        self.ids = {w: i for i, w in enumerate(self.words)}
+        codes = np.frombuffer("".join(self.words).encode("ascii"), dtype=np.uint8).reshape(-1, 5) - ord("a")
+        self.counts = np.zeros((len(self.words), 26), dtype=np.uint8)
+        np.add.at(self.counts, (np.repeat(np.arange(len(self.words)), 5), codes.ravel()), 1)
+
+    def _within(self, pool_counts) -> np.ndarray:
+        return (self.counts <= pool_counts).all(axis=1)
+
+    def formable_mask(self, pool) -> np.ndarray:
+        return self._within(letter_counts(pool))
+
+    def formable(self, pool) -> list:
+        """Words that can be spelled from the pool, using each pool letter at most once."""
+        return [self.words[i] for i in np.flatnonzero(self.formable_mask(pool))]
+
+    def can_form(self, word: str, pool) -> bool:
+        return bool((letter_counts(word) <= letter_counts(pool)).all())
+
+    def generate_pool(self, rng, min_words=5, size=8, min_vowels=2, attempts=50) -> list:
+        """
+        A shuffled pool of `size` letters with at least `min_vowels` vowels
+        from which at least `min_words` words can be formed. Words are drawn
+        from the index one at a time among those whose letters still fit in
+        the pool (union of multisets), so no whole pools are thrown away;
+        leftover slots are filled with random letters, vowels first if short.
+        Returns None if no pool is found within `attempts` fresh starts.
+        """
+        for _ in range(attempts):
+            pool = self.counts[rng.randrange(len(self.words))].copy()
+            while self._within(pool).sum() < min_words:
+                union = np.maximum(self.counts, pool)
+                vowels = union[:, VOWELS].sum(axis=1)
+                needed = union.sum(axis=1) + np.maximum(min_vowels - vowels.astype(int), 0)
+                fits = np.flatnonzero((needed <= size) & ~self._within(pool))
+                if not fits.size:
+                    break
+                pool = union[fits[rng.randrange(fits.size)]]
+            if self._within(pool).sum() < min_words:
+                continue
+
+            letters = [c for c, n in zip(ALPHABET, pool) for _ in range(n)]
+            vowel_count = int(pool[VOWELS].sum())
+            while len(letters) < size:
+                if vowel_count < min_vowels:
+                    letters.append(rng.choice("aeiou"))
+                    vowel_count += 1
+                else:
+                    letters.append(rng.choice(ALPHABET))
+            rng.shuffle(letters)
+            return letters
+        return None
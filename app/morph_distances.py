@@ -0,0 +1,251 @@
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from numpy.lib.format import open_memmap
+
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.morph_graph import one_letter_edges, expand
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+DISTANCES_FILE = os.path.join(DATA_PATH, "morph_distances.npy")
+PARENTS_FILE = os.path.join(DATA_PATH, "morph_parents.npy")
+COUNTS_FILE = os.path.join(DATA_PATH, "morph_path_counts.npy")
+BRANCHING_FILE = os.path.join(DATA_PATH, "morph_branching.npy")
+WORDS_FILE = os.path.join(DATA_PATH, "morph_words.txt")
+
+UNREACHABLE = 255
+MAX_LAYERS = 64
+
+# Bands on MorphDistances.difficulty, roughly tertiles of 4-10 word chains
+BANDS = {"easy": (-np.inf, 0.85), "medium": (0.85, 1.05), "hard": (1.05, np.inf)}
+
+
+def morph_words(max_os=0.5) -> list:
+    """Lower-case words with OS below max_os, the pool Word Morph chains are drawn from."""
+    import pandas as pd
+
+    df = pd.read_csv(os.path.join(DATA_PATH, "final_difficulty_scores.csv"))
+    return sorted(df.loc[df["OS"] < max_os, "Word"].str.lower())
+
+
+def bfs(source, offsets, neighbors) -> tuple:
+    """
+    Level-synchronous BFS from one word. Returns steps (uint8), parent ids
+    (int32, the first frontier word by id that reaches each word), the number
+    of distinct shortest paths to every word (float64, exact below 2**53) and
+    the branching factor of each layer: edges into the next layer per word.
+    Each level expands the whole frontier with array ops.
+    """
+    n = len(offsets) - 1
+    dist = np.full(n, UNREACHABLE, dtype=np.uint8)
+    parent = np.full(n, -1, dtype=np.int32)
+    counts = np.zeros(n, dtype=np.float64)
+    branching = np.zeros(MAX_LAYERS, dtype=np.float32)
+    dist[source] = 0
+    counts[source] = 1
+    frontier = np.array([source], dtype=np.int32)
+    level = 0
+    while frontier.size:
+        level += 1
+        reached, via = expand(frontier, offsets, neighbors)
+        fresh = dist[reached] == UNREACHABLE
+        reached, via = reached[fresh], via[fresh]
+        if level <= MAX_LAYERS:
+            branching[level - 1] = reached.size / frontier.size
+        # Shortest paths to a word = sum over its predecessors in the previous layer
+        counts += np.bincount(reached, weights=counts[via], minlength=n)
+        reached, first = np.unique(reached, return_index=True)
+        dist[reached] = min(level, UNREACHABLE - 1)
+        parent[reached] = via[first]
+        frontier = reached
+    return dist, parent, counts, branching
+
+
+def _bfs_rows(sources, offsets, neighbors, paths):
+    """Worker: BFS from each source and write its rows straight into the memmaps."""
+    outputs = [np.load(p, mmap_mode="r+") for p in paths]
+    for s in sources:
+        for out, row in zip(outputs, bfs(s, offsets, neighbors)):
+            out[s] = row
+    for out in outputs:
+        out.flush()
+    return len(sources)
+
+
+def build_morph_distances(words=None, jobs=1, chunk_size=64, path=DISTANCES_FILE, parents_path=PARENTS_FILE,
+                          counts_path=COUNTS_FILE, branching_path=BRANCHING_FILE, words_path=WORDS_FILE):
+    """
+    All-pairs step counts (uint8, 255 = unreachable), BFS parents, shortest
+    path counts and per-source layer branching, all from one BFS per word.
+    """
+    words = morph_words() if words is None else list(words)
+    offsets, neighbors = one_letter_edges(words)
+    n = len(words)
+
+    layout = [(path, np.uint8, (n, n)), (parents_path, np.int32, (n, n)),
+              (counts_path, np.float64, (n, n)), (branching_path, np.float32, (n, MAX_LAYERS))]
+    tmp_paths = [p + ".tmp.npy" for p, _, _ in layout]
+    for tmp, (_, dtype, shape) in zip(tmp_paths, layout):
+        open_memmap(tmp, mode="w+", dtype=dtype, shape=shape).flush()
+
+    chunks = [range(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for future in [pool.submit(_bfs_rows, c, offsets, neighbors, tmp_paths) for c in chunks]:
+                future.result()
+    else:
+        for c in chunks:
+            _bfs_rows(c, offsets, neighbors, tmp_paths)
+
+    for tmp, (final, _, _) in zip(tmp_paths, layout):
+        os.replace(tmp, final)
+    with open(words_path, "w") as f:
+        f.write("\n".join(words) + "\n")
+    return MorphDistances(words, *(np.load(p, mmap_mode="r") for p, _, _ in layout))
+
+
+class MorphDistances:
+    """
+    Shortest Word Morph step counts between every pair of words, parents to
+    rebuild paths, how many shortest paths each pair has and how widely each
+    start word's BFS branches per layer.
+    """
+
+    def __init__(self, words, distances, parents, counts, branching):
+        self.words = words
+        self.index = {w: i for i, w in enumerate(words)}
+        self.distances = distances
+        self.parents = parents
+        self.counts = counts
+        self.branching = branching
+
+    def distance(self, a: str, b: str):
+        """Steps from a to b, or None if no chain connects them."""
+        d = int(self.distances[self.index[a.lower()], self.index[b.lower()]])
+        return None if d == UNREACHABLE else d
+
+    def path(self, a: str, b: str):
+        """One shortest chain from a to b (both included), or None."""
+        source, target = self.index[a.lower()], self.index[b.lower()]
+        if self.distances[source, target] == UNREACHABLE:
+            return None
+        row = self.parents[source]
+        chain = [target]
+        while chain[-1] != source:
+            chain.append(int(row[chain[-1]]))
+        return [self.words[i] for i in reversed(chain)]
+
+    def routes(self, a: str, b: str) -> int:
+        """Number of distinct shortest chains from a to b (0 if unreachable)."""
+        return int(self.counts[self.index[a.lower()], self.index[b.lower()]])
+
+    def _difficulty_rows(self, sources, steps) -> np.ndarray:
+        """
+        Difficulty of reaching every word from each source in `steps` steps:
+        mean log2 branching over the layers crossed, minus log2(routes) per
+        step. A forced route through a wide search scores high, a target
+        reachable many ways from a narrow start scores low.
+        """
+        sources = np.atleast_1d(sources)
+        steps = np.broadcast_to(steps, (len(sources), self.counts.shape[1]))
+        log_branching = np.log2(np.maximum(self.branching[sources], 1.0))
+        cumulative = np.concatenate([np.zeros((len(sources), 1)), np.cumsum(log_branching, axis=1)], axis=1)
+        depth = np.clip(steps, 1, MAX_LAYERS).astype(np.intp)
+        spread = np.take_along_axis(cumulative, depth, axis=1) / depth
+        routes = np.maximum(self.counts[sources], 1.0)
+        return spread - np.log2(routes) / depth
+
+    def difficulty(self, a: str, b: str):
+        """Difficulty score of the a -> b chain, or None if unreachable."""
+        source, target = self.index[a.lower()], self.index[b.lower()]
+        steps = self.distances[source, target]
+        if steps == UNREACHABLE or steps == 0:
+            return None
+        return float(self._difficulty_rows(source, steps)[0, target])
+
+    def band(self, a: str, b: str):
+        """Name of the difficulty band the a -> b chain falls in, or None."""
+        score = self.difficulty(a, b)
+        if score is None:
+            return None
+        return next(name for name, (low, high) in BANDS.items() if low <= score < high)
+
+    def chain_meta(self, chain) -> dict:
+        """Steps, shortest-route count, per-layer branching, difficulty and band of a chain."""
+        start, end = chain[0], chain[-1]
+        source = self.index[start.lower()]
+        steps = len(chain) - 1
+        return {
+            "start": start,
+            "end": end,
+            "steps": steps,
+            "routes": self.routes(start, end),
+            "branching": [round(float(b), 3) for b in self.branching[source, :min(steps, MAX_LAYERS)]],
+            "difficulty": round(self.difficulty(start, end), 3),
+            "band": self.band(start, end),
+        }
+
+    def sample_chain(self, length: int, rng, band=None, attempts=100):
+        """
+        A random shortest chain of exactly `length` words: pick a start, then a
+        target among the words exactly length - 1 steps away (and, if given,
+        inside the difficulty band). None if none found.
+        """
+        steps = length - 1
+        for _ in range(attempts):
+            source = rng.randrange(len(self.words))
+            mask = np.asarray(self.distances[source]) == steps
+            if band is not None and mask.any():
+                low, high = BANDS[band]
+                score = self._difficulty_rows(source, steps)[0]
+                mask &= (score >= low) & (score < high)
+            targets = np.flatnonzero(mask)
+            if targets.size:
+                return self.path(self.words[source], self.words[int(targets[rng.randrange(targets.size)])])
+        return None
+
+    def __contains__(self, word):
+        return word.lower() in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+
+_loaded = None
+
+
+def load_morph_distances(path=DISTANCES_FILE, parents_path=PARENTS_FILE, counts_path=COUNTS_FILE,
+                         branching_path=BRANCHING_FILE, words_path=WORDS_FILE, build=True):
+    """
+    Memory-mapped distances, building them on first use or when the saved
+    word pool no longer matches morph_words() (or returning None if build=False).
+    """
+    global _loaded
+    if _loaded is None:
+        arrays = [path, parents_path, counts_path, branching_path]
+        words = None
+        if all(os.path.exists(p) for p in arrays + [words_path]):
+            with open(words_path, "r") as f:
+                words = [w.strip() for w in f if w.strip()]
+        if words is not None and words == morph_words():
+            _loaded = MorphDistances(words, *(np.load(p, mmap_mode="r") for p in arrays))
+        elif build:
+            _loaded = build_morph_distances(path=path, parents_path=parents_path, counts_path=counts_path,
+                                            branching_path=branching_path, words_path=words_path)
+    return _loaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the all-pairs Word Morph distance matrix")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    args = parser.parse_args()
+
+    md = build_morph_distances(jobs=args.jobs)
+    reachable = md.distances[md.distances != UNREACHABLE]
+    print(f"✅ Saved {len(md)}x{len(md)} distances to {DISTANCES_FILE}")
+    print(f"⚙️ Connected pairs: {reachable.size - len(md):,}, longest chain: {int(reachable.max())} steps")
+    print(f"⚙️ Most shortest routes between one pair: {int(md.counts.max()):,}")
@@ -0,0 +1,188 @@
+import os
+import sys
+import time
+import random
+import argparse
+import numpy as np
+
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.wordle_logic import encode_words
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+GRAPH_FILE = os.path.join(DATA_PATH, "morph_graph.npz")
+
+
+def one_letter_edges(words) -> tuple:
+    """
+    Adjacency of words differing in exactly one letter, as CSR arrays
+    (int32 offsets, int32 neighbors sorted per word). Words sharing a
+    wildcard pattern like "c_ane" are grouped with one sort per position
+    instead of comparing every pair.
+    """
+    codes = encode_words(words).astype(np.int64)
+    n = len(words)
+    sources, targets = [], []
+    for i in range(5):
+        masked = codes.copy()
+        masked[:, i] = 26
+        keys = masked @ (27 ** np.arange(5))
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, n])
+        for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+            group = order[start:start + size]
+            a, b = np.meshgrid(group, group, indexing="ij")
+            keep = a != b
+            sources.append(a[keep])
+            targets.append(b[keep])
+
+    sources = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+    targets = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+    order = np.lexsort((targets, sources))
+    offsets = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+    return offsets, targets[order].astype(np.int32)
+
+
+def expand(frontier, offsets, neighbors) -> tuple:
+    """All (neighbor, frontier word it was reached from) pairs of a frontier, via CSR slices."""
+    degrees = offsets[frontier + 1] - offsets[frontier]
+    starts = np.repeat(offsets[frontier] - np.cumsum(degrees) + degrees, degrees)
+    return neighbors[starts + np.arange(degrees.sum())], np.repeat(frontier, degrees)
+
+
+class MorphGraph:
+    """
+    One-letter-change graph over the whole dictionary in CSR form. Words are
+    lower-case, like the Word Morph game.
+    """
+
+    def __init__(self, words, offsets, neighbors):
+        self.words = list(words)
+        self.index = {w: i for i, w in enumerate(self.words)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    def neighbors_of(self, word: str) -> list:
+        i = self.index[word.lower()]
+        return [self.words[j] for j in self.neighbors[self.offsets[i]:self.offsets[i + 1]]]
+
+    def adjacent(self, a: str, b: str) -> bool:
+        """True if a and b are both dictionary words exactly one letter apart."""
+        a, b = a.lower(), b.lower()
+        return (a in self.index and b in self.index and len(a) == len(b)
+                and sum(x != y for x, y in zip(a, b)) == 1)
+
+    def is_chain(self, chain) -> bool:
+        """Every step of the chain is a one-letter change between dictionary words."""
+        return all(self.adjacent(a, b) for a, b in zip(chain, chain[1:]))
+
+    def shortest_path(self, a: str, b: str):
+        """
+        A shortest chain from a to b (both included) or None, by bidirectional
+        BFS: each round grows the smaller frontier by one whole level, and the
+        first level that touches the other side yields a shortest chain.
+        """
+        source, target = self.index[a.lower()], self.index[b.lower()]
+        if source == target:
+            return [self.words[source]]
+
+        n = len(self.words)
+        parents = [np.full(n, -1, dtype=np.int32), np.full(n, -1, dtype=np.int32)]
+        seen = [np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)]
+        frontiers = [np.array([source], dtype=np.int32), np.array([target], dtype=np.int32)]
+        seen[0][source] = seen[1][target] = True
+
+        while frontiers[0].size and frontiers[1].size:
+            side = 0 if frontiers[0].size <= frontiers[1].size else 1
+            reached, via = expand(frontiers[side], self.offsets, self.neighbors)
+            fresh = ~seen[side][reached]
+            reached, first = np.unique(reached[fresh], return_index=True)
+            parents[side][reached] = via[fresh][first]
+            seen[side][reached] = True
+
+            meet = reached[seen[1 - side][reached]]
+            if meet.size:
+                return self._join(int(meet[0]), parents, source, target)
+            frontiers[side] = reached
+        return None
+
+    def _join(self, middle, parents, source, target):
+        forward = [middle]
+        while forward[-1] != source:
+            forward.append(int(parents[0][forward[-1]]))
+        backward = []
+        node = middle
+        while node != target:
+            node = int(parents[1][node])
+            backward.append(node)
+        return [self.words[i] for i in reversed(forward)] + [self.words[i] for i in backward]
+
+    def __contains__(self, word):
+        return word.lower() in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+
+def build_morph_graph(words=None, path=GRAPH_FILE) -> MorphGraph:
+    """CSR graph over the dictionary, saved to data/morph_graph.npz."""
+    if words is None:
+        from features.corpus import corpus
+
+        words = [w.lower() for w in corpus.words]
+    offsets, neighbors = one_letter_edges(words)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, words=np.array(words), offsets=offsets, neighbors=neighbors)
+    os.replace(tmp_path, path)
+    return MorphGraph(words, offsets, neighbors)
+
+
+_graph = None
+
+
+def load_morph_graph(path=GRAPH_FILE) -> MorphGraph:
+    """The saved dictionary graph, rebuilt if missing or built from a different word list."""
+    global _graph
+    if _graph is None:
+        from features.corpus import corpus
+
+        words = [w.lower() for w in corpus.words]
+        try:
+            with np.load(path) as data:
+                if data["words"].tolist() == words:
+                    _graph = MorphGraph(words, data["offsets"], data["neighbors"])
+        except (OSError, KeyError, ValueError):
+            pass
+        if _graph is None:
+            _graph = build_morph_graph(words, path)
+    return _graph
+
+
+def benchmark(graph: MorphGraph, pairs=200, seed=0):
+    rng = random.Random(seed)
+    times, lengths = [], []
+    for _ in range(pairs):
+        a, b = rng.sample(graph.words, 2)
+        start = time.perf_counter()
+        chain = graph.shortest_path(a, b)
+        times.append(time.perf_counter() - start)
+        if chain:
+            lengths.append(len(chain))
+    times.sort()
+    print(f"📈 {pairs} random queries, {len(lengths)} connected (mean chain {np.mean(lengths):.1f} words)")
+    print(f"   median {times[len(times) // 2] * 1000:.2f} ms, max {times[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Word Morph CSR graph over the full dictionary")
+    parser.add_argument("--benchmark", action="store_true", help="Time shortest-chain queries on random pairs")
+    args = parser.parse_args()
+
+    graph = build_morph_graph()
+    print(f"✅ Saved {len(graph):,} words / {len(graph.neighbors):,} directed edges to {GRAPH_FILE}")
+    if args.benchmark:
+        benchmark(graph)
@@ -0,0 +1,130 @@
+from functools import lru_cache
+import numpy as np
+
+FACTORS = ["LFS", "PLFS", "RLP", "HLT", "WSA", "OS"]
+
+
+class ScoreIndex:
+    """
+    Words sorted by one score (e.g. ODS). nearest() finds the k closest words
+    with a binary search plus a two-pointer walk outwards, O(log n + k).
+    Ties on distance keep the order the words were given in, like a stable sort.
+    """
+
+    def __init__(self, words, scores):
+        scores = np.asarray(scores, dtype=float)
+        self.order = np.lexsort((np.arange(len(scores)), scores))
+        self.words = [words[i] for i in self.order]
+        self.scores = scores[self.order]
+
+    def nearest(self, score: float, k: int = 5, exclude=None) -> list:
+        """[(word, |score difference|)] for the k closest words, skipping `exclude`."""
+        scores, words = self.scores, self.words
+        n = len(scores)
+        right = int(np.searchsorted(scores, score))
+        left = right - 1
+        picked = []
+        while len(picked) < k and (left >= 0 or right < n):
+            d_left = abs(scores[left] - score) if left >= 0 else np.inf
+            d_right = abs(scores[right] - score) if right < n else np.inf
+            if d_left <= d_right:
+                i, left = left, left - 1
+            else:
+                i, right = right, right + 1
+            if words[i] != exclude:
+                picked.append(i)
+        if not picked:
+            return []
+
+        # Pull in every word tied with the k-th distance, then order the
+        # handful of candidates by (distance, original position)
+        cutoff = abs(scores[picked[-1]] - score)
+        while left >= 0 and abs(scores[left] - score) <= cutoff:
+            if words[left] != exclude:
+                picked.append(left)
+            left -= 1
+        while right < n and abs(scores[right] - score) <= cutoff:
+            if words[right] != exclude:
+                picked.append(right)
+            right += 1
+        picked.sort(key=lambda i: (abs(scores[i] - score), self.order[i]))
+        return [(words[i], float(abs(scores[i] - score))) for i in picked[:k]]
+
+    def between(self, low: float, high: float) -> list:
+        """Words scoring in [low, high], easiest first."""
+        lo = np.searchsorted(self.scores, low, side="left")
+        hi = np.searchsorted(self.scores, high, side="right")
+        return self.words[lo:hi]
+
+
+class FactorIndex:
+    """
+    k-nearest words in the six-factor space (LFS, PLFS, RLP, HLT, WSA, OS),
+    over float32 vectors. The KD-tree is built on the first query.
+    """
+
+    def __init__(self, words, vectors):
+        self.words = list(words)
+        self.ids = {w: i for i, w in enumerate(self.words)}
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self._tree = None
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            from scipy.spatial import cKDTree
+
+            self._tree = cKDTree(self.vectors)
+        return self._tree
+
+    def nearest(self, query, k: int = 5, exclude=None) -> list:
+        """
+        [(word, euclidean distance)] for the k closest words to a word in the
+        index or a 6-factor vector. A word query excludes itself.
+        """
+        if isinstance(query, str):
+            exclude = query if exclude is None else exclude
+            query = self.vectors[self.ids[query]]
+        extra = 1 if exclude is not None else 0
+        n = min(k + extra, len(self.words))
+        distances, ids = self.tree.query(np.asarray(query, dtype=np.float32), k=n)
+        found = [(self.words[i], float(d)) for d, i in zip(np.atleast_1d(distances), np.atleast_1d(ids))
+                 if self.words[i] != exclude]
+        return found[:k]
+
+
+def _store_subset(words=None):
+    from app.difficulty_store import load_difficulty_store
+
+    store = load_difficulty_store()
+    if words is None:
+        ids = np.asarray(store.order)
+    else:
+        ids = np.array([i for i in (store.row_id(w) for w in words) if i >= 0], dtype=np.int64)
+    return store, [store.words[i].decode() for i in ids], ids
+
+
+def _subset_words(subset: str):
+    if subset == "dictionary":
+        return None
+    if subset == "answers":
+        from app.percentiles import answer_words
+
+        return list(dict.fromkeys(answer_words()))
+    raise ValueError("subset must be 'answers' or 'dictionary'")
+
+
+@lru_cache(maxsize=None)
+def ods_index(subset: str = "answers") -> ScoreIndex:
+    """ODS neighbor index over past answers or the full dictionary."""
+    from features.ods import round3
+
+    store, words, ids = _store_subset(_subset_words(subset))
+    return ScoreIndex(words, round3(store.column("ODS")[ids]))
+
+
+@lru_cache(maxsize=None)
+def factor_index(subset: str = "dictionary") -> FactorIndex:
+    """Six-factor neighbor index over past answers or the full dictionary."""
+    store, words, ids = _store_subset(_subset_words(subset))
+    return FactorIndex(words, np.column_stack([store.column(f)[ids] for f in FACTORS]))
@@ -0,0 +1,103 @@
+import os
+import re
+import numpy as np
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '..', 'models')
+ANSWERS_FILE = os.path.join(DATA_PATH, "actual_words.txt")
+WSA_PERCENTILES_FILE = os.path.join(MODELS_PATH, "wsa_percentiles.csv")
+
+KINDS = ("rank", "weak", "strict", "mean")
+
+
+class PercentileService:
+    """
+    Percentile-of-score queries against named reference sets. Each set is kept
+    as one sorted float array, so a query is two binary searches instead of a
+    pass over the list. Results match scipy.stats.percentileofscore.
+
+    Sets are added with register(name, values), or with register_loader(name, fn)
+    to read them on first use.
+    """
+
+    def __init__(self):
+        self._sets = {}
+        self._loaders = {}
+
+    def register(self, name: str, values):
+        values = np.sort(np.asarray(values, dtype=float))
+        if values.size == 0:
+            raise ValueError(f"reference set {name!r} is empty")
+        if np.isnan(values).any():
+            raise ValueError(f"reference set {name!r} contains NaN")
+        self._sets[name] = values
+        self._loaders.pop(name, None)
+
+    def register_loader(self, name: str, loader):
+        self._sets.pop(name, None)
+        self._loaders[name] = loader
+
+    def reference(self, name: str) -> np.ndarray:
+        """Sorted values of a reference set, loading it if needed."""
+        if name not in self._sets:
+            if name not in self._loaders:
+                raise KeyError(f"unknown reference set {name!r}")
+            self.register(name, self._loaders[name]())
+        return self._sets[name]
+
+    def percentiles(self, name: str, scores, kind: str = "rank") -> np.ndarray:
+        """Percentile (0-100) of each score within the named set."""
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}")
+        ranked = self.reference(name)
+        scores = np.asarray(scores, dtype=float)
+        left = np.searchsorted(ranked, scores, side="left")
+        right = np.searchsorted(ranked, scores, side="right")
+        n = len(ranked)
+        # Same arithmetic as scipy, so results are bit-identical
+        if kind == "rank":
+            result = (left + right + (right > left)) * (50.0 / n)
+        elif kind == "weak":
+            result = right * (100.0 / n)
+        elif kind == "strict":
+            result = left * (100.0 / n)
+        else:
+            result = (left + right) * (50.0 / n)
+        return np.where(np.isnan(scores), np.nan, result)
+
+    def percentile(self, name: str, score: float, kind: str = "rank") -> float:
+        return float(self.percentiles(name, [score], kind)[0])
+
+    def __contains__(self, name):
+        return name in self._sets or name in self._loaders
+
+    def names(self) -> list:
+        return sorted(set(self._sets) | set(self._loaders))
+
+
+def answer_words() -> list:
+    """Past Wordle answers, upper-case, in file order."""
+    with open(ANSWERS_FILE, "r") as f:
+        return [w.upper() for w in re.findall(r"\b[a-z]{5}\b", f.read().lower())]
+
+
+def _ods_of(words=None) -> np.ndarray:
+    from app.difficulty_store import load_difficulty_store
+    from features.ods import round3
+
+    store = load_difficulty_store()
+    ods = store.column("ODS")
+    if words is None:
+        return round3(ods)
+    ids = np.array([store.row_id(w) for w in words])
+    return round3(ods[ids[ids >= 0]])
+
+
+def _wsa_percentiles() -> np.ndarray:
+    return np.loadtxt(WSA_PERCENTILES_FILE, delimiter=",", skiprows=1)
+
+
+percentiles = PercentileService()
+percentiles.register_loader("answers", lambda: _ods_of(answer_words()))
+percentiles.register_loader("dictionary", _ods_of)
+percentiles.register_loader("wsa", _wsa_percentiles)
@@ -0,0 +1,100 @@
+import os
+import json
+import numpy as np
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+BANK_FILE = os.path.join(DATA_PATH, "grid_puzzles.jsonl")
+INDEX_FILE = os.path.join(DATA_PATH, "grid_puzzles.idx")
+
+CLUE_ROWS = 4
+
+# One fixed-size index record per puzzle: where its JSON line sits in the bank,
+# the solution's OS and the compatible-set size after each clue row (0 = no row)
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("length", "<u4"),
+    ("os", "<f4"),
+    ("compatible", "<u2", (CLUE_ROWS,)),
+])
+
+
+def append_puzzles(puzzles, path=BANK_FILE, index_path=INDEX_FILE) -> int:
+    """
+    Append puzzles ({"solution", "guesses", "os", "compatible"}) to the bank.
+    Lines are written before their index records, so an interrupted write
+    never leaves an index entry pointing past the end of the bank.
+    """
+    records = np.zeros(len(puzzles), dtype=INDEX_DTYPE)
+    with open(path, "ab") as bank:
+        offset = bank.tell()
+        for i, puzzle in enumerate(puzzles):
+            line = (json.dumps(puzzle, separators=(",", ":")) + "\n").encode()
+            bank.write(line)
+            compatible = puzzle["compatible"][:CLUE_ROWS]
+            records[i] = (offset, len(line), puzzle["os"], compatible + [0] * (CLUE_ROWS - len(compatible)))
+            offset += len(line)
+    with open(index_path, "ab") as index:
+        index.write(records.tobytes())
+    return len(puzzles)
+
+
+class PuzzleBank:
+    """
+    Read-only random access to the puzzle bank. The index is memory-mapped
+    and puzzles are read one line at a time, so opening a large bank is free.
+    """
+
+    def __init__(self, path=BANK_FILE, index_path=INDEX_FILE):
+        self.path = path
+        size = os.path.getsize(index_path) // INDEX_DTYPE.itemsize
+        self.index = (np.memmap(index_path, dtype=INDEX_DTYPE, mode="r", shape=(size,))
+                      if size else np.zeros(0, dtype=INDEX_DTYPE))
+        self._file = None
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, i) -> dict:
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        record = self.index[i]
+        self._file.seek(int(record["offset"]))
+        return json.loads(self._file.read(int(record["length"])))
+
+    def ids(self, max_os=None, max_first_row=None) -> np.ndarray:
+        """Puzzle ids whose solution OS is below max_os and first row leaves at most max_first_row words."""
+        mask = np.ones(len(self.index), dtype=bool)
+        if max_os is not None:
+            mask &= self.index["os"] < max_os
+        if max_first_row is not None:
+            mask &= self.index["compatible"][:, 0] <= max_first_row
+        return np.flatnonzero(mask)
+
+    def view(self, ids=None) -> "BankView":
+        return BankView(self, self.ids() if ids is None else ids)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BankView:
+    """A subset of bank puzzles as a read-only sequence, loading each on access."""
+
+    def __init__(self, bank, ids):
+        self.bank = bank
+        self.ids = np.asarray(ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i) -> dict:
+        return self.bank[int(self.ids[i])]
+
+
+def open_puzzle_bank(path=BANK_FILE, index_path=INDEX_FILE):
+    """The bank if it has been built, otherwise None."""
+    if os.path.exists(path) and os.path.exists(index_path):
+        return PuzzleBank(path, index_path)
+    return None
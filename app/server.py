@@ -0,0 +1,333 @@
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+# Allow relative imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.calculator import calculate_difficulty_batch
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BATCH_WORDS = 10_000
+MAX_BODY_BYTES = 1024 * 1024
+IDLE_TIMEOUT = 15.0
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def normalize(word) -> str:
+    if not isinstance(word, str):
+        raise HTTPError(400, f"{word!r} is not a 5-letter word")
+    word = word.strip().upper()
+    if len(word) != 5 or not (word.isascii() and word.isalpha()):
+        raise HTTPError(400, f"{word!r} is not a 5-letter word")
+    return word
+
+
+def score_records(words) -> list:
+    df = calculate_difficulty_batch(words)
+    return df.to_dict("records")
+
+
+class MicroBatcher:
+    """
+    Coalesces single-word requests: the first queued word opens a window of
+    `window` seconds (or until max_batch words arrive), then the whole batch
+    is scored in one vectorized call off the event loop. The queue is bounded;
+    submit() raises HTTPError(503) instead of waiting when it is full, and
+    score() does the same when queued plus in-flight POST words would pass
+    max_queue (a batch is always admitted when nothing else is pending).
+    """
+
+    def __init__(self, window=0.002, max_batch=512, max_queue=4096):
+        self.window = window
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.pending_words = 0
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.batches = 0
+        self.words = 0
+        self.rejected = 0
+
+    async def submit(self, word) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((word, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise HTTPError(503, "scoring queue is full, retry later")
+        return await future
+
+    async def score(self, words) -> list:
+        """Score an explicit batch (POST) on the same worker thread."""
+        backlog = self.pending_words + self.queue.qsize()
+        if backlog and backlog + len(words) > self.max_queue:
+            self.rejected += 1
+            raise HTTPError(503, "scoring queue is full, retry later")
+        loop = asyncio.get_running_loop()
+        self.pending_words += len(words)
+        try:
+            return await loop.run_in_executor(self.executor, score_records, words)
+        finally:
+            self.pending_words -= len(words)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Anything already queued rides along without waiting further
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            words = [w for w, _ in batch]
+            try:
+                records = await loop.run_in_executor(self.executor, score_records, words)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches += 1
+            self.words += len(batch)
+            for (_, future), record in zip(batch, records):
+                if not future.done():
+                    future.set_result(record)
+
+
+class ScoringServer:
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+        self.requests = 0
+
+    async def handle(self, method, path, query, body):
+        if path == "/score":
+            if method != "GET":
+                raise HTTPError(405, "use GET /score?word=...")
+            words = query.get("word")
+            if not words:
+                raise HTTPError(400, "missing ?word=")
+            return await self.batcher.submit(normalize(words[0]))
+
+        if path == "/score/batch":
+            if method != "POST":
+                raise HTTPError(405, "use POST /score/batch")
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError:
+                raise HTTPError(400, "body must be JSON")
+            words = payload.get("words") if isinstance(payload, dict) else payload
+            if not isinstance(words, list):
+                raise HTTPError(400, 'body must be a JSON list of words or {"words": [...]}')
+            if len(words) > MAX_BATCH_WORDS:
+                raise HTTPError(413, f"at most {MAX_BATCH_WORDS} words per request")
+            words = [normalize(w) for w in words]
+            return await self.batcher.score(words) if words else []
+
+        if path == "/health":
+            return {"status": "ok"}
+
+        if path == "/stats":
+            b = self.batcher
+            return {"requests": self.requests, "batches": b.batches, "batched_words": b.words,
+                    "avg_batch": round(b.words / b.batches, 2) if b.batches else 0.0,
+                    "queued": b.queue.qsize(), "pending_batch_words": b.pending_words,
+                    "rejected": b.rejected}
+
+        raise HTTPError(404, f"no route for {path}")
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 413, {"error": "headers too large"}, keep_alive=False)
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ")
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "bad request line"}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                # Reject bad or oversized bodies before reading them; the
+                # connection is closed since the body framing can't be trusted
+                raw_length = headers.get("content-length", "0") or "0"
+                if not raw_length.isdigit():
+                    await self.respond(writer, 400, {"error": "bad Content-Length"}, keep_alive=False)
+                    break
+                length = int(raw_length)
+                if length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {"error": f"body larger than {MAX_BODY_BYTES} bytes"},
+                                       keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                url = urlsplit(target)
+                self.requests += 1
+                try:
+                    status, payload = 200, await self.handle(method, url.path, parse_qs(url.query), body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        headers = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8000, window=0.002, max_batch=512, max_queue=4096):
+    # Load every feature table once, before accepting connections
+    score_records(["CRANE"])
+
+    batcher = MicroBatcher(window, max_batch, max_queue)
+    server = ScoringServer(batcher)
+    worker = asyncio.create_task(batcher.run())
+    tcp = await asyncio.start_server(server.serve_connection, host, port, limit=MAX_HEADER_BYTES)
+    print(f"✅ Scoring server listening on http://{host}:{port}", flush=True)
+    try:
+        async with tcp:
+            await tcp.serve_forever()
+    finally:
+        worker.cancel()
+
+
+async def _client(host, port, words, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for word in words:
+            start = time.perf_counter()
+            writer.write(f"GET /score?word={word} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(head.split(b"\r\n")[0].decode())
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, connections=64, requests=200):
+    """
+    Fire requests over `connections` keep-alive connections, each sending
+    `requests` sequential GET /score calls, and report throughput and latency.
+    """
+    from features.corpus import corpus
+
+    words = corpus.words
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, [words[(c * requests + i) % len(words)] for i in range(requests)], latencies, errors)
+        for c in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b"GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n")
+    stats = json.loads((await reader.read()).split(b"\r\n\r\n", 1)[1])
+    writer.close()
+
+    latencies.sort()
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print(f"📈 {len(latencies):,} requests over {connections} connections in {elapsed:.2f}s")
+    print(f"   throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"   latency: p50 {pct(50):.2f} ms, p99 {pct(99):.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+    print(f"   avg batch: {stats['avg_batch']} words over {stats['batches']} batches, {len(errors)} errors")
+    return {"throughput": len(latencies) / elapsed, "p50_ms": pct(50), "p99_ms": pct(99), "errors": len(errors)}
+
+
+def run_load_test(connections, requests, window):
+    """Start a server on a free port in a subprocess, load test it, then stop it."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    proc = subprocess.Popen([sys.executable, "-m", "app.server", "--port", str(port), "--window", str(window)],
+                            cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')),
+                            stdout=subprocess.PIPE, text=True)
+    try:
+        proc.stdout.readline()  # wait for the listening line
+        return asyncio.run(load_test("127.0.0.1", port, connections, requests))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP scoring service for calculate_difficulty")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--window", type=float, default=0.002, help="Micro-batch window in seconds")
+    parser.add_argument("--max-batch", type=int, default=512, help="Most words scored in one batch")
+    parser.add_argument("--max-queue", type=int, default=4096, help="Queued words before answering 503")
+    parser.add_argument("--load-test", action="store_true", help="Benchmark a fresh server instead of serving")
+    parser.add_argument("--connections", type=int, default=64, help="Load test: concurrent connections")
+    parser.add_argument("--requests", type=int, default=200, help="Load test: requests per connection")
+    args = parser.parse_args()
+
+    if args.load_test:
+        run_load_test(args.connections, args.requests, args.window)
+    else:
+        try:
+            asyncio.run(serve(args.host, args.port, args.window, args.max_batch, args.max_queue))
+        except KeyboardInterrupt:
+            pass
@@ -1,37 +1,102 @@
 import os
-import pandas as pd
-from collections import Counter
-from scipy.stats import rankdata
+from functools import lru_cache
+import numpy as np
+from features.corpus import corpus
+from features.table_cache import load_feature_tables
+from features.wordle_logic import encode_words
+from features.ods import round3
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
-# Load dictionary
-with open(os.path.join(DATA_PATH, "words.txt"), "r") as f:
-    all_words = [w.strip().upper() for w in f if len(w.strip()) == 5]
+def build_bigram_arrays(all_words):
+    """
+    Bigram rarity grid (26, 26) (NaN where missing) and the normalized HLT of
+    every word in all_words, in order.
+    """
+    import pandas as pd
+    from scipy.stats import rankdata
 
-# Load bigram rarity data
-bigram_df = pd.read_csv(os.path.join(DATA_PATH, "bigram_log_rarity_scores.csv"))
-bigram_scores = {
-    row["bigram"].upper(): float(row["log_rarity_score"])
-    for _, row in bigram_df.iterrows()
-    if isinstance(row["bigram"], str) and isinstance(row["log_rarity_score"], (int, float))
-}
+    # Load bigram rarity data
+    bigram_df = pd.read_csv(os.path.join(DATA_PATH, "bigram_log_rarity_scores.csv"))
+    scores = {
+        row["bigram"].upper(): float(row["log_rarity_score"])
+        for _, row in bigram_df.iterrows()
+        if isinstance(row["bigram"], str) and isinstance(row["log_rarity_score"], (int, float))
+    }
+    grid = np.array([[scores.get(a + b, np.nan) for b in LETTERS] for a in LETTERS])
+
+    # Compute raw HLT for all words
+    raw_hlt_values = [_raw_hlt(w, scores) for w in all_words]
+
+    # Convert to percentile ranks
+    ranks = rankdata(raw_hlt_values, method='average')
+    hlt = np.array([round((rank - 1) / (len(all_words) - 1), 3) for rank in ranks])
+    return grid, hlt
+
+def _raw_hlt(word: str, scores: dict) -> float:
+    bigrams = [word[i:i+2] for i in range(4)]
+    return sum(scores.get(bg, 0.5) for bg in bigrams) / 4
+
+@lru_cache(maxsize=None)
+def bigram_scores() -> dict:
+    """Bigram rarity data, read from the feature table cache on first use."""
+    grid = load_feature_tables()["bigram_scores"]
+    return {
+        a + b: score
+        for a, row in zip(LETTERS, grid.tolist())
+        for b, score in zip(LETTERS, row)
+        if score == score
+    }
 
 def original_hlt(word: str) -> float:
     """Compute raw average bigram rarity score for a word (before normalization)."""
-    word = word.upper()
-    bigrams = [word[i:i+2] for i in range(4)]
-    return sum(bigram_scores.get(bg, 0.5) for bg in bigrams) / 4
+    return _raw_hlt(word.upper(), bigram_scores())
+
+@lru_cache(maxsize=None)
+def normalized_hlt_map() -> dict:
+    """Percentile rank of every dictionary word's raw HLT."""
+    # Kept as np.float64 (no tolist), so round() on ODS and ExpectedGuesses
+    # follows numpy rounding like the stored scores
+    return dict(zip(corpus.words, load_feature_tables()["hlt"]))
+
+def raw_hlt_batch(codes) -> np.ndarray:
+    """Raw HLT for (n, 5) letter codes, summed bigram by bigram like _raw_hlt."""
+    grid = np.nan_to_num(load_feature_tables()["bigram_scores"], nan=0.5)
+    scores = grid[codes[:, :4], codes[:, 1:]]
+    return (scores[:, 0] + scores[:, 1] + scores[:, 2] + scores[:, 3]) / 4
 
-# Compute raw HLT for all words
-raw_hlt_values = [original_hlt(w) for w in all_words]
+@lru_cache(maxsize=None)
+def sorted_raw_hlt() -> np.ndarray:
+    return np.sort(raw_hlt_batch(corpus.codes))
 
-# Convert to percentile ranks
-ranks = rankdata(raw_hlt_values, method='average')
-normalized_hlt_map = {
-    word: round((rank - 1) / (len(all_words) - 1), 3)
-    for word, rank in zip(all_words, ranks)
-}
+def oov_hlt_batch(codes) -> np.ndarray:
+    """
+    Percentile of out-of-dictionary words' raw HLT among the dictionary's,
+    i.e. the normalized HLT each word would get if it were added (ties averaged).
+    """
+    ranked = sorted_raw_hlt()
+    raw = raw_hlt_batch(codes)
+    left = np.searchsorted(ranked, raw, side="left")
+    right = np.searchsorted(ranked, raw, side="right")
+    return round3((left + right) / (2 * len(ranked)))
 
 def compute_hlt(word: str) -> float:
-    return normalized_hlt_map.get(word.upper(), 0.5)  # default to 0.5 if word not found
+    word = word.upper()
+    hlt = normalized_hlt_map().get(word)
+    if hlt is not None:
+        return hlt
+    if len(word) == 5 and word.isascii() and word.isalpha():
+        return float(oov_hlt_batch(encode_words([word]))[0])
+    return 0.5  # default to 0.5 if the word cannot be scored
+
+def compute_hlt_batch(words, codes=None) -> np.ndarray:
+    """compute_hlt for a list of upper-case 5-letter words (codes from encode_words if given)."""
+    hlt = load_feature_tables()["hlt"]
+    ids = corpus.ids(words)
+    result = hlt[ids]
+    missing = ids < 0
+    if missing.any():
+        codes = encode_words(words) if codes is None else codes
+        result[missing] = oov_hlt_batch(codes[missing])
+    return result
@@ -0,0 +1,78 @@
+import numpy as np
+
+
+class CompiledForest:
+    """
+    A fitted RandomForestRegressor flattened into contiguous node arrays
+    (feature, threshold, left, right, value) with every tree laid end to end.
+    Leaves point to themselves, so predict() walks all trees for all rows in
+    lockstep, one depth level per step, with no per-tree Python loop.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, feature_names):
+        # Indices are stored as int32 and widened once here, so gathers skip a cast
+        self.feature = feature.astype(np.intp)
+        self.threshold = threshold
+        self.left = left.astype(np.intp)
+        self.right = right.astype(np.intp)
+        self.value = value
+        self.roots = roots.astype(np.intp)
+        self.max_depth = int(max_depth)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.n_features_in_ = len(feature_names)
+
+    @classmethod
+    def from_sklearn(cls, model) -> "CompiledForest":
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            n = tree.node_count
+            ids = np.arange(offset, offset + n, dtype=np.int32)
+            leaf = tree.children_left < 0
+            features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(leaf, 0.0, tree.threshold))
+            lefts.append(np.where(leaf, ids, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(leaf, ids, tree.children_right + offset).astype(np.int32))
+            values.append(tree.value[:, 0, 0].astype(np.float64))
+            roots.append(offset)
+            offset += n
+        names = getattr(model, "feature_names_in_", [f"x{i}" for i in range(model.n_features_in_)])
+        return cls(
+            np.concatenate(features), np.concatenate(thresholds),
+            np.concatenate(lefts), np.concatenate(rights), np.concatenate(values),
+            np.array(roots, dtype=np.int32),
+            max(e.tree_.max_depth for e in model.estimators_),
+            list(names),
+        )
+
+    def save(self, path):
+        np.savez(path, feature=self.feature.astype(np.int32), threshold=self.threshold,
+                 left=self.left.astype(np.int32), right=self.right.astype(np.int32),
+                 value=self.value, roots=self.roots.astype(np.int32), max_depth=np.array(self.max_depth),
+                 feature_names=np.array(list(self.feature_names_in_)))
+
+    @classmethod
+    def load(cls, path) -> "CompiledForest":
+        with np.load(path) as data:
+            return cls(data["feature"], data["threshold"], data["left"], data["right"], data["value"],
+                       data["roots"], data["max_depth"], data["feature_names"].tolist())
+
+    def predict(self, X) -> np.ndarray:
+        # sklearn compares float32 inputs against float64 thresholds; do the same
+        X = np.asarray(X, dtype=np.float32)
+        n_rows, n_trees = len(X), len(self.roots)
+        flat_X = X.ravel()
+        nodes = np.tile(self.roots, n_rows)
+        row_start = np.repeat(np.arange(n_rows) * X.shape[1], n_trees)
+
+        # Step every (row, tree) pair that has not reached a leaf yet
+        active = np.flatnonzero(self.right[nodes] != nodes)
+        while active.size:
+            current = nodes[active]
+            go_left = flat_X[row_start[active] + self.feature[current]] <= self.threshold[current]
+            current = np.where(go_left, self.left[current], self.right[current])
+            nodes[active] = current
+            active = active[self.right[current] != current]
+
+        return self.value[nodes].reshape(n_rows, n_trees).sum(axis=1) / n_trees
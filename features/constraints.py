@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+from features.wordle_logic import get_feedback, pattern_to_code
+
+# Set bits per byte, for numpy builds without np.bitwise_count
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits: np.ndarray) -> int:
+    """Number of set bits in a packed uint64 bitset."""
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(POPCOUNT[bits.view(np.uint8)].sum())
+
+
+class ConstraintEngine:
+    """
+    Solutions consistent with Reverse Wordle clues, as packed bitsets over a
+    fixed solution list. The bitset for each (guess, pattern) pair is cut
+    from the pattern matrix on first use and kept in an LRU, so a puzzle's
+    compatible set is a few ANDs and a popcount.
+    """
+
+    def __init__(self, pattern_matrix, solutions, maxsize=65_536):
+        self.pattern_matrix = pattern_matrix
+        self.solutions = [w.upper() for w in solutions]
+        self.index = {w: i for i, w in enumerate(self.solutions)}
+        self.solution_ids = pattern_matrix.ids(self.solutions)
+        self.words = len(self.solutions)
+        # Pad to whole uint64 words so ANDs and popcounts run 64 bits at a time
+        self.blocks = -(-self.words // 64)
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bitset(self, guess: str, code: int) -> np.ndarray:
+        """Solutions that give `code` when `guess` is played, as a uint64 bitset."""
+        key = (guess.upper(), int(code))
+        with self._lock:
+            bits = self._lru.get(key)
+            if bits is not None:
+                self._lru.move_to_end(key)
+                return bits
+
+        row = self.pattern_matrix.row(key[0])[self.solution_ids] == key[1]
+        packed = np.zeros(self.blocks * 8, dtype=np.uint8)
+        packed[:-(-self.words // 8)] = np.packbits(row, bitorder="little")
+        bits = packed.view(np.uint64)
+
+        with self._lock:
+            self._lru[key] = bits
+            if len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+        return bits
+
+    def compatible(self, clues) -> np.ndarray:
+        """AND of the bitsets of every (guess, feedback) clue; feedback is 'GYB...' or a code."""
+        result = np.full(self.blocks, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for guess, feedback in clues:
+            code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+            np.bitwise_and(result, self.bitset(guess, code), out=result)
+        return result
+
+    def count(self, clues) -> int:
+        """How many solutions fit every clue."""
+        bits = self.compatible(clues)
+        # Clear the padding past the last solution
+        tail = self.words % 64
+        if tail:
+            bits[-1] &= np.uint64((1 << tail) - 1)
+        return popcount(bits)
+
+    def is_unique(self, clues) -> bool:
+        return self.count(clues) == 1
+
+    def narrowing(self, clues) -> list:
+        """Compatible-set size after each clue row in turn (the last one is count(clues))."""
+        result = np.full(self.blocks, np.iinfo(np.uint64).max, dtype=np.uint64)
+        tail = self.words % 64
+        if tail:
+            result[-1] = np.uint64((1 << tail) - 1)
+        sizes = []
+        for guess, feedback in clues:
+            code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+            np.bitwise_and(result, self.bitset(guess, code), out=result)
+            sizes.append(popcount(result))
+        return sizes
+
+    def solutions_for(self, clues) -> list:
+        """Every solution that fits the clues, in solution-list order."""
+        bits = np.unpackbits(self.compatible(clues).view(np.uint8), count=self.words, bitorder="little")
+        return [self.solutions[i] for i in np.flatnonzero(bits)]
+
+    def consistent(self, word: str, clues) -> bool:
+        """True if `word` would have produced every clue, read straight from the pattern matrix."""
+        word = word.upper()
+        if word not in self.pattern_matrix:
+            return False
+        for guess, feedback in clues:
+            code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+            if self.pattern_matrix.code(guess.upper(), word) != code:
+                return False
+        return True
+
+    def feedback(self, guess: str, solution: str) -> str:
+        return self.pattern_matrix.pattern(guess.upper(), solution.upper())
+
+
+_engine = None
+
+
+def load_constraint_engine() -> ConstraintEngine:
+    """Shared engine over the whole dictionary."""
+    global _engine
+    if _engine is None:
+        from features.corpus import corpus
+        from features.pattern_matrix import load_pattern_matrix
+
+        _engine = ConstraintEngine(load_pattern_matrix(), corpus.words)
+    return _engine
+
+
+def fits_clues(word: str, clues) -> bool:
+    """
+    True if `word` is a dictionary word that would have produced every
+    (guess, feedback) clue. The pattern matrix is used only if it is already
+    on disk, so the GUI never triggers the full build; otherwise the few
+    clues are scored directly.
+    """
+    from features.corpus import corpus
+    from features.pattern_matrix import load_pattern_matrix
+
+    word = word.upper()
+    if word not in corpus:
+        return False
+    matrix = load_pattern_matrix(build=False)
+    for guess, feedback in clues:
+        code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+        if matrix is not None and guess.upper() in matrix:
+            actual = matrix.code(guess.upper(), word)
+        else:
+            actual = pattern_to_code(get_feedback(word, guess.upper()))
+        if actual != code:
+            return False
+    return True
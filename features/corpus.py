@@ -0,0 +1,65 @@
+import os
+import numpy as np
+from features.wordle_logic import encode_words
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+WORDS_FILE = os.path.join(DATA_PATH, "words.txt")
+
+
+class WordCorpus:
+    """
+    The 5-letter dictionary from data/words.txt, read once on first access.
+    Holds a single word list, its (n, 5) uint8 letter codes and a word -> id index.
+    """
+
+    def __init__(self, path=WORDS_FILE):
+        self.path = path
+        self._words = None
+        self._codes = None
+        self._index = None
+
+    def _load(self):
+        with open(self.path, "r") as f:
+            words = [w.strip().upper() for w in f if len(w.strip()) == 5]
+        self._codes = encode_words(words)
+        self._index = {w: i for i, w in enumerate(words)}
+        self._words = words
+
+    @property
+    def words(self) -> list:
+        if self._words is None:
+            self._load()
+        return self._words
+
+    @property
+    def codes(self) -> np.ndarray:
+        if self._words is None:
+            self._load()
+        return self._codes
+
+    @property
+    def index(self) -> dict:
+        if self._words is None:
+            self._load()
+        return self._index
+
+    def ids(self, words) -> np.ndarray:
+        """Word ids for a list of words, -1 where a word is not in the dictionary."""
+        index = self.index
+        return np.fromiter((index.get(w, -1) for w in words), dtype=np.int32, count=len(words))
+
+    def reload(self):
+        """Drop the loaded list so the next access re-reads the file."""
+        self._words = self._codes = self._index = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def __iter__(self):
+        return iter(self.words)
+
+
+corpus = WordCorpus()
@@ -1,28 +1,46 @@
-import os
 from collections import Counter
+from functools import lru_cache
+import numpy as np
+from features.table_cache import load_feature_tables
+from features.ods import builtin_round3
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def build_letter_arrays(all_words):
+    """Letter weights (26,) and positional weights (5, 26); NaN for letters never seen."""
+    # Letter frequency
+    letter_counts = Counter("".join(all_words))
+    max_letter_freq = max(letter_counts.values())
+    letter_weights = {c: 1 - (f / max_letter_freq) for c, f in letter_counts.items()}
+
+    # Positional frequency
+    position_counters = [Counter() for _ in range(5)]
+    for word in all_words:
+        for i, c in enumerate(word):
+            position_counters[i][c] += 1
+    max_pos_freq = [max(p.values()) for p in position_counters]
+    position_weights = [
+        {c: 1 - (count / max_pos_freq[i]) for c, count in pos.items()}
+        for i, pos in enumerate(position_counters)
+    ]
+
+    letter_array = np.array([letter_weights.get(c, np.nan) for c in LETTERS])
+    position_array = np.array([[pos.get(c, np.nan) for c in LETTERS] for pos in position_weights])
+    return letter_array, position_array
+
+def _weights_dict(row) -> dict:
+    return {c: w for c, w in zip(LETTERS, row.tolist()) if w == w}
+
+@lru_cache(maxsize=None)
+def letter_tables():
+    """Letter and positional weight dicts, read from the feature table cache on first use."""
+    tables = load_feature_tables()
+    letter_weights = _weights_dict(tables["letter_weights"])
+    position_weights = [_weights_dict(row) for row in tables["position_weights"]]
+    return letter_weights, position_weights
 
-DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
-
-# Load all words
-with open(os.path.join(DATA_PATH, "words.txt"), "r") as f:
-    all_words = [w.strip().upper() for w in f if len(w.strip()) == 5]
-
-# Letter frequency
-letter_counts = Counter("".join(all_words))
-max_letter_freq = max(letter_counts.values())
-letter_weights = {c: 1 - (f / max_letter_freq) for c, f in letter_counts.items()}
-
-# Positional frequency
-position_counters = [Counter() for _ in range(5)]
-for word in all_words:
-    for i, c in enumerate(word):
-        position_counters[i][c] += 1
-max_pos_freq = [max(p.values()) for p in position_counters]
-position_weights = [
-    {c: 1 - (count / max_pos_freq[i]) for c, count in pos.items()}
-    for i, pos in enumerate(position_counters)
-]
 def compute_lfs(word: str) -> float:
+    letter_weights, _ = letter_tables()
     raw = sum(letter_weights.get(c, 0.5) for c in word.upper()) / 5
     # Custom remapping:
     if raw <= 0.4:
@@ -31,7 +49,33 @@ def compute_lfs(word: str) -> float:
         return round(0.5 + ((raw - 0.4) * (0.5 / 0.4)), 3)  # Map 0.4–0.8 to 0.5–1.0
 
 def compute_plfs(word: str) -> float:
+    _, position_weights = letter_tables()
     return round(sum(position_weights[i].get(c, 0.5) for i, c in enumerate(word.upper())) / 5, 3)
 
 def compute_rlp(word: str) -> float:
     return 1.0 if len(set(word.upper())) < 5 else 0.0
+
+@lru_cache(maxsize=None)
+def letter_arrays():
+    """Letter (26,) and positional (5, 26) weights with the 0.5 default filled in."""
+    tables = load_feature_tables()
+    return np.nan_to_num(tables["letter_weights"], nan=0.5), np.nan_to_num(tables["position_weights"], nan=0.5)
+
+def compute_lfs_batch(codes) -> np.ndarray:
+    """compute_lfs for (n, 5) letter codes from encode_words."""
+    letter_weights, _ = letter_arrays()
+    weights = letter_weights[codes]
+    # Add letters one at a time, like sum() does, so the floats match exactly
+    raw = weights[:, 0] + weights[:, 1] + weights[:, 2] + weights[:, 3] + weights[:, 4]
+    raw = raw / 5
+    return builtin_round3(np.where(raw <= 0.4, raw * (0.5 / 0.4), 0.5 + ((raw - 0.4) * (0.5 / 0.4))))
+
+def compute_plfs_batch(codes) -> np.ndarray:
+    _, position_weights = letter_arrays()
+    weights = position_weights[np.arange(5), codes]
+    raw = weights[:, 0] + weights[:, 1] + weights[:, 2] + weights[:, 3] + weights[:, 4]
+    return builtin_round3(raw / 5)
+
+def compute_rlp_batch(codes) -> np.ndarray:
+    ordered = np.sort(codes, axis=1)
+    return (ordered[:, 1:] == ordered[:, :-1]).any(axis=1).astype(float)
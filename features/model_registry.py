@@ -0,0 +1,127 @@
+import os
+import time
+import threading
+from collections import deque
+import numpy as np
+
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '..', 'models')
+WSA_MODEL_FILE = os.path.join(MODELS_PATH, "wsa_regressor.pkl")
+WSA_FEATURES_FILE = os.path.join(MODELS_PATH, "wsa_features.csv")
+WSA_COMPILED_FILE = os.path.join(MODELS_PATH, "wsa_regressor.npz")
+
+
+def read_feature_names(path) -> list:
+    """Feature names written by the training script, one per line."""
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+class ModelStats:
+    """Call count, rows and latency of predict calls (latency over the last `window` calls)."""
+
+    def __init__(self, window=1000):
+        self.calls = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, rows, seconds):
+        self.calls += 1
+        self.rows += rows
+        self.total_seconds += seconds
+        self.latencies.append(seconds)
+
+    def summary(self) -> dict:
+        lat = np.array(self.latencies) * 1000
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(float(np.percentile(lat, 50)), 3) if lat.size else 0.0,
+            "p99_ms": round(float(np.percentile(lat, 99)), 3) if lat.size else 0.0,
+        }
+
+
+class ModelRegistry:
+    """
+    Named models loaded once per process. On load, a model's
+    feature_names_in_ must match its features file, so a retrained model and
+    a stale feature list fail loudly instead of predicting on shuffled columns.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._models = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, path: str, features_path: str = None):
+        with self._lock:
+            self._entries[name] = (path, features_path)
+            self._models.pop(name, None)
+
+    def get(self, name: str):
+        """The loaded model, reading and validating it on first use."""
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    if name not in self._entries:
+                        raise KeyError(f"no model registered as {name!r}")
+                    path, features_path = self._entries[name]
+                    model = self._load(path, features_path)
+                    self._models[name] = model
+                    self._stats.setdefault(name, ModelStats())
+        return model
+
+    @staticmethod
+    def _load(path, features_path):
+        if path.endswith(".npz"):
+            from features.compiled_forest import CompiledForest
+
+            model = CompiledForest.load(path)
+        else:
+            import joblib
+
+            model = joblib.load(path)
+        if features_path is not None:
+            expected = read_feature_names(features_path)
+            actual = list(getattr(model, "feature_names_in_", expected))
+            if actual != expected:
+                raise ValueError(f"{os.path.basename(path)} was trained on {actual}, "
+                                 f"but {os.path.basename(features_path)} lists {expected}")
+        return model
+
+    def feature_names(self, name: str) -> list:
+        model = self.get(name)
+        if hasattr(model, "feature_names_in_"):
+            return list(model.feature_names_in_)
+        return read_feature_names(self._entries[name][1])
+
+    def predict(self, name: str, X) -> np.ndarray:
+        """model.predict on a (rows, features) array, timed into the model's stats."""
+        import pandas as pd
+
+        model = self.get(name)
+        X = pd.DataFrame(np.asarray(X, dtype=float), columns=self.feature_names(name))
+        start = time.perf_counter()
+        result = model.predict(X)
+        self._stats[name].record(len(X), time.perf_counter() - start)
+        return result
+
+    def warm_up(self, *names):
+        """Load the named models (all registered ones by default) and run one prediction each."""
+        for name in names or list(self._entries):
+            self.predict(name, np.zeros((1, len(self.feature_names(name)))))
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def stats(self, name: str) -> dict:
+        return self._stats[name].summary() if name in self._stats else ModelStats().summary()
+
+
+registry = ModelRegistry()
+registry.register("wsa", WSA_MODEL_FILE, WSA_FEATURES_FILE)
+registry.register("wsa_compiled", WSA_COMPILED_FILE, WSA_FEATURES_FILE)
@@ -1,16 +1,20 @@
 import os
-import pandas as pd
+from functools import lru_cache
+import numpy as np
+from features.ods import builtin_round3
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
 FREQ_FILE = os.path.join(DATA_PATH, 'word_frequencies.csv')
 
-# Load frequency data
-freq_df = pd.read_csv(FREQ_FILE)
-freq_df = freq_df[freq_df['word'].apply(lambda x: isinstance(x, str) and len(x) == 5)]
-freq_df['word'] = freq_df['word'].str.upper()
+@lru_cache(maxsize=None)
+def freq_map() -> dict:
+    """Word -> corpus frequency, loaded on first use."""
+    import pandas as pd
 
-# Build frequency dictionary
-freq_map = dict(zip(freq_df['word'], freq_df['frequency']))
+    freq_df = pd.read_csv(FREQ_FILE)
+    freq_df = freq_df[freq_df['word'].apply(lambda x: isinstance(x, str) and len(x) == 5)]
+    freq_df['word'] = freq_df['word'].str.upper()
+    return dict(zip(freq_df['word'], freq_df['frequency']))
 
 def remap_frequency(freq: float) -> float:
     """
@@ -33,7 +37,34 @@ def remap_frequency(freq: float) -> float:
 
 def compute_os(word: str) -> float:
     word = word.upper()
-    freq = freq_map.get(word, 0)
+    freq = freq_map().get(word, 0)
     if freq == 0:
         return 1.0
     return remap_frequency(freq)
+
+@lru_cache(maxsize=None)
+def freq_series():
+    """freq_map as a pandas Series, for vectorized lookups."""
+    import pandas as pd
+
+    return pd.Series(freq_map(), dtype=float)
+
+def remap_frequency_batch(freqs) -> np.ndarray:
+    """remap_frequency over an array of positive frequencies."""
+    freqs = np.asarray(freqs, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        os_scores = np.select(
+            [freqs >= 2_000_000, (100_000 <= freqs) & (freqs < 2_000_000), (50_000 <= freqs) & (freqs < 100_000)],
+            [
+                0.0 + (2_000_000 / freqs) * 0.5,
+                0.5 + ((2_000_000 - freqs) / (2_000_000 - 100_000)) * 0.2,
+                0.7 + ((100_000 - freqs) / (100_000 - 50_000)) * 0.2,
+            ],
+            1.0,
+        )
+    return builtin_round3(os_scores)
+
+def compute_os_batch(words) -> np.ndarray:
+    """compute_os for a list of upper-case words."""
+    freqs = freq_series().reindex(words).fillna(0).to_numpy()
+    return np.where(freqs == 0, 1.0, remap_frequency_batch(freqs))
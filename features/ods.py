@@ -0,0 +1,54 @@
+import numpy as np
+
+def compute_ods(lfs: float, plfs: float, rlp: float, hlt: float, wsa: float, os_score: float) -> float:
+    """
+    Overall Difficulty Score: weighted combination of the six factors, rounded
+    with numpy like the stored scores (the original HLT was an np.float64).
+    """
+    return float(np.round(
+        0.25 * lfs +
+        0.15 * plfs +
+        0.15 * rlp +
+        0.15 * hlt +
+        0.15 * wsa +
+        0.15 * os_score,
+        3
+    ))
+
+def compute_expected_guesses(ods: float) -> float:
+    return float(np.round(2.5 + ods * 3.5, 3))
+
+def round3(values) -> np.ndarray:
+    """
+    np.round(values, 3), the rounding compute_ods and compute_expected_guesses
+    (and so the stored scores) use.
+    """
+    return np.round(np.asarray(values, dtype=float), 3)
+
+def builtin_round3(values) -> np.ndarray:
+    """
+    Array version of Python's round(x, 3) on floats, for factors whose scalar
+    functions round plain floats. np.round scales by 1000 first, which can tip
+    values sitting next to a .0005 tie the other way, so those few are
+    rounded with Python's round.
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.round(values, 3)
+    near_tie = np.abs(np.abs(values * 1000) % 1 - 0.5) < 1e-6
+    if near_tie.any():
+        out[near_tie] = [round(v, 3) for v in values[near_tie].tolist()]
+    return out
+
+def compute_ods_batch(lfs, plfs, rlp, hlt, wsa, os_score) -> np.ndarray:
+    """compute_ods over arrays, summed in the same order."""
+    return round3(
+        0.25 * lfs +
+        0.15 * plfs +
+        0.15 * rlp +
+        0.15 * hlt +
+        0.15 * wsa +
+        0.15 * os_score
+    )
+
+def compute_expected_guesses_batch(ods) -> np.ndarray:
+    return round3(2.5 + ods * 3.5)
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from features.corpus import corpus
+from features.true_wsa import STARTERS, compute_true_wsa_batch
+from features.table_cache import source_hash
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+TRUE_WSA_FILE = os.path.join(DATA_PATH, "true_wsa_scores.csv")
+CACHE_DB = os.path.join(DATA_PATH, ".oov_wsa_cache.sqlite")
+
+
+@lru_cache(maxsize=None)
+def wsa_range() -> tuple:
+    """(min, max) RawWSA the stored WSA column was normalized with."""
+    import pandas as pd
+
+    raw = pd.read_csv(TRUE_WSA_FILE, usecols=["RawWSA"], float_precision="round_trip")["RawWSA"]
+    return float(raw.min()), float(raw.max())
+
+
+def normalize_wsa(raw: float) -> float:
+    """Same min/max scaling as true_wsa_scores.csv, clipped to [0, 1] for words past either end."""
+    min_val, max_val = wsa_range()
+    return min(1.0, max(0.0, round((raw - min_val) / (max_val - min_val), 3)))
+
+
+class RawWSACache:
+    """
+    Raw WSA for words outside the dictionary: a size-bounded in-memory LRU in
+    front of an SQLite table, so a word is only scored once across runs. Rows
+    are keyed by the dictionary and starters they were computed against.
+    """
+
+    def __init__(self, path=CACHE_DB, maxsize=10_000):
+        self.path = path
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._db = None
+        self._key = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            self._key = hashlib.sha1((source_hash() + ",".join(STARTERS)).encode()).hexdigest()[:16]
+        return self._key
+
+    def _connect(self):
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS raw_wsa "
+                             "(key TEXT, word TEXT, raw REAL, PRIMARY KEY (key, word))")
+        return self._db
+
+    def _remember(self, word, raw):
+        self._lru[word] = raw
+        self._lru.move_to_end(word)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def get_many(self, words) -> list:
+        """Raw WSA for upper-case 5-letter words, computing and storing any not cached yet."""
+        with self._lock:
+            found = {}
+            for w in words:
+                if w in self._lru:
+                    self._lru.move_to_end(w)
+                    found[w] = self._lru[w]
+
+            missing = list(dict.fromkeys(w for w in words if w not in found))
+            if missing:
+                db = self._connect()
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    rows = db.execute(
+                        f"SELECT word, raw FROM raw_wsa WHERE key = ? AND word IN ({','.join('?' * len(chunk))})",
+                        [self.key, *chunk]).fetchall()
+                    found.update(rows)
+
+                new = [w for w in missing if w not in found]
+                if new:
+                    raw = compute_true_wsa_batch(new, corpus.words)
+                    with db:
+                        db.executemany("INSERT OR REPLACE INTO raw_wsa VALUES (?, ?, ?)",
+                                       [(self.key, w, r) for w, r in zip(new, raw)])
+                    found.update(zip(new, raw))
+                for w in missing:
+                    self._remember(w, found[w])
+            return [found[w] for w in words]
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            if os.path.exists(self.path):
+                with self._connect() as db:
+                    db.execute("DELETE FROM raw_wsa")
+
+
+cache = RawWSACache()
+
+
+def compute_oov_wsa_batch(words) -> list:
+    """Normalized WSA for upper-case 5-letter words that have no stored score."""
+    return [normalize_wsa(raw) for raw in cache.get_many(words)]
+
+
+def compute_oov_wsa(word: str) -> float:
+    return compute_oov_wsa_batch([word.upper()])[0]
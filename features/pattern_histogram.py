@@ -0,0 +1,80 @@
+from collections import OrderedDict
+import numpy as np
+from features.wordle_logic import get_feedback_batch
+from features.pattern_matrix import load_pattern_matrix
+
+N_PATTERNS = 243
+
+
+class StarterHistograms:
+    """
+    For each starter, how many solutions fall into each of the 243 feedback
+    patterns. The candidates left after a starter are exactly the solutions
+    sharing the word's pattern, so counts become a histogram lookup.
+    """
+
+    def __init__(self, starters, solutions, counts=None):
+        self.starters = list(starters)
+        self.solutions = solutions
+        self.n_solutions = len(solutions)
+        self._codes = None
+        if counts is None:
+            counts = self.bucket_counts(solutions)
+        self.counts = counts
+
+    @property
+    def codes(self) -> np.ndarray:
+        if self._codes is None:
+            self._codes = pattern_codes(self.starters, self.solutions)
+        return self._codes
+
+    def bucket_counts(self, words) -> np.ndarray:
+        """(n_starters, 243) histogram of the words' patterns against each starter."""
+        codes = self.word_codes(words)
+        return np.stack([np.bincount(row, minlength=N_PATTERNS) for row in codes]).astype(np.int64)
+
+    def word_codes(self, words) -> np.ndarray:
+        """(n_starters, len(words)) pattern codes of each starter against each word."""
+        if words is self.solutions or list(words) == self.solutions:
+            return self.codes
+        return pattern_codes(self.starters, words)
+
+    def remaining(self, words) -> np.ndarray:
+        """(len(words), n_starters) number of solutions left after each starter."""
+        codes = self.word_codes(words)
+        return np.take_along_axis(self.counts, codes.astype(np.intp), axis=1).T
+
+
+def pattern_codes(guesses, solutions) -> np.ndarray:
+    """Pattern codes (guess x solution), read from the pattern matrix when it covers the words."""
+    pm = load_pattern_matrix(build=False)
+    if pm is not None and pm.covers(guesses) and pm.covers(solutions):
+        guess_ids = pm.ids(guesses)
+        if len(solutions) == len(pm) and list(solutions) == pm.words:
+            return np.asarray(pm.codes[guess_ids])
+        return np.asarray(pm.codes[guess_ids][:, pm.ids(solutions)])
+    return get_feedback_batch(guesses, solutions)
+
+
+# Most recently used (starters, solutions) histograms, keyed by content
+_cache = OrderedDict()
+CACHE_SIZE = 4
+
+
+def get_histograms(starters, solutions) -> StarterHistograms:
+    """
+    Cached StarterHistograms for a (starters, solutions) pair. Lists are
+    matched by their words, so an edited or rebuilt list never reuses stale
+    histograms; only the CACHE_SIZE most recent pairs are kept.
+    """
+    key = (tuple(starters), tuple(solutions))
+    hist = _cache.get(key)
+    if hist is None:
+        # Own copy, so later edits to the caller's list cannot reach the cache
+        hist = StarterHistograms(starters, list(solutions))
+        _cache[key] = hist
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return hist
@@ -0,0 +1,109 @@
+import os
+import sys
+import numpy as np
+
+# Allow running as a script: python features/pattern_matrix.py
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.wordle_logic import code_to_pattern, encode_words, get_feedback_batch
+from features.corpus import corpus
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+MATRIX_FILE = os.path.join(DATA_PATH, "pattern_matrix.npy")
+MATRIX_WORDS_FILE = os.path.join(DATA_PATH, "pattern_matrix_words.txt")
+
+# Guesses computed per block while building (temporaries are BLOCK_SIZE x N)
+BLOCK_SIZE = 256
+
+
+def load_words(path):
+    with open(path, "r") as f:
+        return [w.strip().upper() for w in f if len(w.strip()) == 5]
+
+
+class PatternMatrix:
+    """Read-only view over the guess x solution pattern codes (0-242, base 3)."""
+
+    def __init__(self, codes, words, index=None):
+        self.codes = codes
+        self.words = words
+        self.index = index if index is not None else {w: i for i, w in enumerate(words)}
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+    def covers(self, words) -> bool:
+        return all(w in self.index for w in words)
+
+    def ids(self, words) -> np.ndarray:
+        return np.fromiter((self.index[w] for w in words), dtype=np.int32, count=len(words))
+
+    def row(self, guess: str) -> np.ndarray:
+        return self.codes[self.index[guess]]
+
+    def code(self, guess: str, solution: str) -> int:
+        return int(self.codes[self.index[guess], self.index[solution]])
+
+    def pattern(self, guess: str, solution: str) -> str:
+        return code_to_pattern(self.code(guess, solution))
+
+
+def build_pattern_matrix(words=None, path=MATRIX_FILE, words_path=MATRIX_WORDS_FILE):
+    """Compute every guess x solution pattern code and save it as a .npy file."""
+    if words is None:
+        words = corpus.words
+    encoded = encode_words(words)
+    n = len(words)
+
+    tmp_path = path + ".tmp.npy"
+    out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.uint8, shape=(n, n))
+    for start in range(0, n, BLOCK_SIZE):
+        out[start:start + BLOCK_SIZE] = get_feedback_batch(encoded[start:start + BLOCK_SIZE], encoded)
+    out.flush()
+    del out
+
+    os.replace(tmp_path, path)
+    with open(words_path, "w") as f:
+        f.write("\n".join(words) + "\n")
+    return path
+
+
+_matrix = None
+_missing = False
+
+
+def load_pattern_matrix(path=MATRIX_FILE, words_path=MATRIX_WORDS_FILE, build=True) -> PatternMatrix:
+    """
+    Memory-map the pattern matrix (read-only, shared between processes).
+    Builds it first if missing or out of date with data/words.txt,
+    or returns None in that case when build=False.
+    """
+    global _matrix, _missing
+    if path == MATRIX_FILE:
+        if _matrix is not None:
+            return _matrix
+        if _missing and not build:
+            return None
+
+    words = corpus.words
+    stale = not (os.path.exists(path) and os.path.exists(words_path)) or load_words(words_path) != words
+    if stale:
+        if not build:
+            _missing = path == MATRIX_FILE
+            return None
+        build_pattern_matrix(words, path, words_path)
+
+    matrix = PatternMatrix(np.load(path, mmap_mode="r"), words, corpus.index)
+    if path == MATRIX_FILE:
+        _matrix = matrix
+    return matrix
+
+
+if __name__ == "__main__":
+    words = corpus.words
+    print(f"Building {len(words)} x {len(words)} pattern matrix...")
+    build_pattern_matrix(words)
+    print(f"✅ Saved pattern matrix to {MATRIX_FILE}")
@@ -1,42 +1,42 @@
-from collections import Counter
+import numpy as np
+from features.pattern_histogram import get_histograms, StarterHistograms
 
-def get_feedback(solution: str, guess: str) -> str:
-    """Return Wordle-style feedback string for a guess (G, Y, B)."""
-    feedback = ["B"] * 5
-    sc = Counter(solution)
-    for i in range(5):
-        if guess[i] == solution[i]:
-            feedback[i] = "G"
-            sc[guess[i]] -= 1
-    for i in range(5):
-        if feedback[i] == "B" and sc[guess[i]] > 0:
-            feedback[i] = "Y"
-            sc[guess[i]] -= 1
-    return "".join(feedback)
+def compute_shape_features(word: str, all_words: list, starter_words: list) -> dict:
+    return compute_shape_features_batch([word.upper()], all_words, starter_words)[0]
 
-def matches(word: str, guess: str, feedback: str) -> bool:
-    return get_feedback(word, guess) == feedback
+def compute_shape_features_batch(words: list, all_words: list, starter_words: list) -> list:
+    """Shape features for many words from one set of starter histograms."""
+    return shape_features_from_histograms(get_histograms(starter_words, all_words), words)
 
-def compute_shape_features(word: str, all_words: list, starter_words: list) -> dict:
-    total_elim = 0
-    match_reduction = 0
-    greens, yellows, grays = 0, 0, 0
+def shape_features_from_histograms(hist: StarterHistograms, words: list) -> list:
+    codes = hist.word_codes(words).astype(np.int64)
+    remaining = np.take_along_axis(hist.counts, codes, axis=1)
 
-    for guess in starter_words:
-        fb = get_feedback(word, guess)
-        remaining = [w for w in all_words if matches(w, guess, fb)]
-        total_elim += len(all_words) - len(remaining)
-        match_reduction += len(all_words) / max(1, len(remaining))
+    n_all = hist.n_solutions
+    total_elim = np.zeros(len(words), dtype=np.int64)
+    match_reduction = np.zeros(len(words))
+    greens = np.zeros(len(words), dtype=np.int64)
+    yellows = np.zeros(len(words), dtype=np.int64)
 
-        greens += fb.count("G")
-        yellows += fb.count("Y")
-        grays += fb.count("B")
+    # Accumulate starter by starter to keep the same float summation order
+    for s in range(len(hist.starters)):
+        total_elim += n_all - remaining[s]
+        match_reduction += n_all / np.maximum(1, remaining[s])
+        for i in range(5):
+            digit = codes[s] // 3 ** i % 3
+            greens += digit == 2
+            yellows += digit == 1
 
-    n = len(starter_words)
-    return {
-        "MatchReduction": round(match_reduction / n, 3),
-        "AvgElimination": round(total_elim / n, 3),
-        "FeedbackGreen": round(greens / (5 * n), 3),
-        "FeedbackYellow": round(yellows / (5 * n), 3),
-        "FeedbackGray": round(grays / (5 * n), 3),
-    }
+    n = len(hist.starters)
+    grays = 5 * n - greens - yellows
+    return [
+        {
+            "MatchReduction": round(mr / n, 3),
+            "AvgElimination": round(te / n, 3),
+            "FeedbackGreen": round(g / (5 * n), 3),
+            "FeedbackYellow": round(y / (5 * n), 3),
+            "FeedbackGray": round(b / (5 * n), 3),
+        }
+        for mr, te, g, y, b in zip(match_reduction.tolist(), total_elim.tolist(),
+                                   greens.tolist(), yellows.tolist(), grays.tolist())
+    ]
@@ -0,0 +1,60 @@
+import os
+import hashlib
+import zipfile
+from functools import lru_cache
+import numpy as np
+from features.corpus import corpus
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+CACHE_FILE = os.path.join(DATA_PATH, ".feature_tables.npz")
+SOURCE_FILES = [
+    os.path.join(DATA_PATH, "words.txt"),
+    os.path.join(DATA_PATH, "bigram_log_rarity_scores.csv"),
+]
+
+
+def source_hash() -> str:
+    """SHA-256 over the data files the derived tables are built from."""
+    h = hashlib.sha256()
+    for path in SOURCE_FILES:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def build_feature_tables() -> dict:
+    from features.letter_features import build_letter_arrays
+    from features.bigram_features import build_bigram_arrays
+
+    words = corpus.words
+    letter_weights, position_weights = build_letter_arrays(words)
+    bigram_scores, hlt = build_bigram_arrays(words)
+    return {
+        "words": np.array(words),
+        "letter_weights": letter_weights,
+        "position_weights": position_weights,
+        "bigram_scores": bigram_scores,
+        "hlt": hlt,
+    }
+
+
+@lru_cache(maxsize=None)
+def load_feature_tables() -> dict:
+    """
+    Derived feature tables (letter/positional weights, bigram scores, normalized HLT
+    per word id), loaded from the binary cache or rebuilt when the sources changed.
+    """
+    key = source_hash()
+    try:
+        with np.load(CACHE_FILE) as data:
+            if str(data["source_hash"]) == key:
+                return {name: data[name] for name in data.files if name != "source_hash"}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass
+
+    tables = build_feature_tables()
+    # Per-process temp name, so concurrent cold-cache workers never share a half-written file
+    tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, source_hash=np.array(key), **tables)
+    os.replace(tmp_path, CACHE_FILE)
+    return tables
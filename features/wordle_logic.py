@@ -1,29 +1,70 @@
 # features/wordle_logic.py
 
-from collections import Counter
+import numpy as np
 
-def get_feedback(solution: str, guess: str) -> str:
+# Feedback letters are packed base 3 (B=0, Y=1, G=2), position i weighted 3**i
+FEEDBACK_DIGITS = {"B": 0, "Y": 1, "G": 2}
+FEEDBACK_LETTERS = "BYG"
+ALL_GREEN = 242
+
+def encode_words(words) -> np.ndarray:
     """
-    Returns Wordle-style feedback string: 'G', 'Y', or 'B' for each letter.
+    Encode 5-letter words as an (n, 5) uint8 array of letter indices (A=0 ... Z=25).
+    Arrays that are already encoded are passed through unchanged.
     """
-    solution = solution.upper()
-    guess = guess.upper()
-    feedback = ["B"] * 5
-    counter = Counter(solution)
+    if isinstance(words, np.ndarray):
+        return words
+    joined = "".join(words).upper()
+    if len(joined) != 5 * len(words) or not (joined.isascii() and (joined.isalpha() or not joined)):
+        raise ValueError("Every word must be exactly 5 ASCII letters.")
+    return np.frombuffer(joined.encode("ascii"), dtype=np.uint8).reshape(-1, 5) - ord("A")
+
+def get_feedback_batch(guesses, solutions) -> np.ndarray:
+    """
+    Returns a (len(guesses), len(solutions)) uint8 array of pattern codes,
+    one for every guess/solution pair, using the same two-pass rules as Wordle.
+    """
+    guesses = encode_words(guesses)
+    solutions = encode_words(solutions)
+    n_g, n_s = len(guesses), len(solutions)
 
     # Green pass
-    for i in range(5):
-        if guess[i] == solution[i]:
-            feedback[i] = "G"
-            counter[guess[i]] -= 1
+    green = [guesses[:, i, None] == solutions[None, :, i] for i in range(5)]
 
-    # Yellow pass
+    # Yellow pass: position i is yellow while the solution still has unclaimed
+    # copies of its letter after greens and earlier yellows took theirs
+    codes = np.zeros((n_g, n_s), dtype=np.uint8)
     for i in range(5):
-        if feedback[i] == "B" and counter[guess[i]] > 0:
-            feedback[i] = "Y"
-            counter[guess[i]] -= 1
+        letter = guesses[:, i, None]
+        available = np.zeros((n_g, n_s), dtype=np.uint8)
+        for j in range(5):
+            available += (letter == solutions[None, :, j]) & ~green[j]
+        claimed = np.zeros((n_g, n_s), dtype=np.uint8)
+        for k in range(i):
+            claimed += (guesses[:, k, None] == letter) & ~green[k]
+        yellow = ~green[i] & (available > claimed)
+        codes += green[i].view(np.uint8) * np.uint8(2 * 3 ** i) + yellow.view(np.uint8) * np.uint8(3 ** i)
 
-    return "".join(feedback)
+    return codes
+
+def get_feedback(solution: str, guess: str) -> str:
+    """
+    Returns Wordle-style feedback string: 'G', 'Y', or 'B' for each letter.
+    """
+    return code_to_pattern(get_feedback_batch([guess], [solution])[0, 0])
 
 def matches(candidate: str, guess: str, feedback: str) -> bool:
-    return get_feedback(candidate, guess) == feedback
+    return int(get_feedback_batch([guess], [candidate])[0, 0]) == pattern_to_code(feedback)
+
+def pattern_to_code(feedback: str) -> int:
+    """Pack a 'GYB' feedback string into its integer code (0-242)."""
+    return sum(FEEDBACK_DIGITS[c] * 3 ** i for i, c in enumerate(feedback))
+
+def code_to_pattern(code: int) -> str:
+    """Unpack an integer code (0-242) back into a 'GYB' feedback string."""
+    code = int(code)
+    letters = []
+    for _ in range(5):
+        code, digit = divmod(code, 3)
+        letters.append(FEEDBACK_LETTERS[digit])
+    return "".join(letters)
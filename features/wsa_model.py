@@ -1,36 +1,46 @@
 import os
-import joblib
 import numpy as np
-from features.shape_features import compute_shape_features
-from features.letter_features import compute_lfs, compute_plfs, compute_rlp
-from features.bigram_features import compute_hlt
+from features.shape_features import compute_shape_features_batch
+from features.letter_features import compute_lfs_batch, compute_plfs_batch, compute_rlp_batch
+from features.bigram_features import compute_hlt_batch
+from features.model_registry import registry, WSA_MODEL_FILE, WSA_COMPILED_FILE
+from features.wordle_logic import encode_words
+from features.corpus import corpus
 
-DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
-MODEL_PATH = os.path.join(os.path.dirname(__file__), '..', 'models', 'wsa_regressor.pkl')
-
-# Load dictionary and starter words
-with open(os.path.join(DATA_PATH, "words.txt"), "r") as f:
-    all_words = [w.strip().upper() for w in f if len(w.strip()) == 5]
+MODEL_PATH = WSA_MODEL_FILE
 
 starter_words = ["STARE", "CRANE", "SLATE", "AUDIO", "RAISE", "TRACE", "ARISE", "CARTE", "SALET", "REACT"]
 
-# Load trained model
-def load_wsa_model():
-    return joblib.load(MODEL_PATH)
-
-def predict_wsa_score(word: str, model=None) -> float:
-    if model is None:
-        model = load_wsa_model()
+def default_model_name() -> str:
+    # The array-compiled forest predicts the same values with far less per-call overhead
+    return "wsa_compiled" if os.path.exists(WSA_COMPILED_FILE) else "wsa"
 
-    shape_feats = compute_shape_features(word, all_words, starter_words)
-
-    features = {
-        "LFS": compute_lfs(word),
-        "PLFS": compute_plfs(word),
-        "RLP": compute_rlp(word),
-        "HLT": compute_hlt(word),
-        **shape_feats
+# Trained model, loaded once through the registry
+def load_wsa_model():
+    return registry.get(default_model_name())
+
+def wsa_feature_matrix(words: list, feature_names: list) -> np.ndarray:
+    """(len(words), len(feature_names)) model inputs for upper-case 5-letter words."""
+    codes = encode_words(words)
+    columns = {
+        "LFS": compute_lfs_batch(codes),
+        "PLFS": compute_plfs_batch(codes),
+        "RLP": compute_rlp_batch(codes),
+        "HLT": compute_hlt_batch(words, codes),
     }
+    shape_feats = compute_shape_features_batch(words, corpus.words, starter_words)
+    for name in shape_feats[0] if shape_feats else []:
+        columns[name] = np.array([f[name] for f in shape_feats])
+    return np.column_stack([columns[f] for f in feature_names])
+
+def predict_wsa_batch(words, model=None) -> np.ndarray:
+    """Predicted WSA for many words with one model.predict call."""
+    words = [w.upper() for w in words]
+    if model is not None:
+        X = wsa_feature_matrix(words, list(model.feature_names_in_))
+        return model.predict(X)
+    name = default_model_name()
+    return registry.predict(name, wsa_feature_matrix(words, registry.feature_names(name)))
 
-    X = np.array([[features[f] for f in model.feature_names_in_]])
-    return float(model.predict(X)[0])
+def predict_wsa_score(word: str, model=None) -> float:
+    return float(predict_wsa_batch([word], model)[0])
@@ -1,10 +1,16 @@
 import os
-import joblib
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.model_registry import registry
 
 def load_wsa_model(path=None):
+    """The WSA regressor from the shared registry (loaded once per path)."""
     if path is None:
-        base_dir = os.path.dirname(__file__)
-        path = os.path.join(base_dir, "wsa_regressor.pkl")
-    
-    model = joblib.load(path)
-    return model
+        return registry.get("wsa")
+
+    name = os.path.abspath(path)
+    if name not in registry:
+        registry.register(name, path)
+    return registry.get(name)
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import app.calculator as calculator
+
+SCORES_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'final_difficulty_scores.csv')
+COLUMNS = ["LFS", "PLFS", "RLP", "HLT", "WSA", "OS", "ODS", "ExpectedGuesses"]
+
+
+@pytest.fixture(scope="module")
+def stored():
+    return pd.read_csv(SCORES_FILE, float_precision="round_trip")
+
+
+@pytest.fixture
+def stored_os(stored, monkeypatch):
+    """OS read back from the CSV, since word_frequencies.csv is not checked in."""
+    os_by_word = dict(zip(stored["Word"].str.upper(), stored["OS"].tolist()))
+    monkeypatch.setattr(calculator, "compute_os", lambda word: os_by_word[word.upper()])
+    monkeypatch.setattr(calculator, "compute_os_batch", lambda words: np.array([os_by_word[w] for w in words]))
+    return os_by_word
+
+
+def mismatches(results, stored) -> dict:
+    return {col: int((results[col] != stored[col]).sum()) for col in COLUMNS}
+
+
+def test_scalar_matches_stored_scores(stored, stored_os):
+    results = pd.DataFrame([calculator.calculate_difficulty(w) for w in stored["Word"]])
+    assert mismatches(results, stored) == {col: 0 for col in COLUMNS}
+
+
+def test_batch_matches_scalar_and_stored_scores(stored, stored_os):
+    batch = calculator.calculate_difficulty_batch(stored["Word"].tolist())
+    assert mismatches(batch, stored) == {col: 0 for col in COLUMNS}
+
+    scalar = pd.DataFrame([calculator.calculate_difficulty(w) for w in stored["Word"]])
+    assert mismatches(batch, scalar) == {col: 0 for col in COLUMNS}
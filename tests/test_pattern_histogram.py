@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features import pattern_histogram
+from features.pattern_histogram import CACHE_SIZE, StarterHistograms, get_histograms
+
+STARTERS = ["SLATE", "CRANE"]
+
+
+def test_edited_list_gets_fresh_histograms():
+    words = ["CRANE", "SLATE", "FETCH"]
+    first = get_histograms(STARTERS, words)
+    words.append("BRUNG")
+    second = get_histograms(STARTERS, words)
+    assert second is not first
+    assert (second.counts == StarterHistograms(STARTERS, list(words)).counts).all()
+    assert first.n_solutions == 3 and first.counts.sum() == 2 * 3
+
+
+def test_equal_lists_share_an_entry_and_the_cache_is_bounded():
+    words = ["CRANE", "SLATE", "FETCH"]
+    assert get_histograms(STARTERS, words) is get_histograms(STARTERS, list(words))
+    for i in range(CACHE_SIZE + 3):
+        get_histograms(STARTERS, words[:1] * (i + 1))
+    assert len(pattern_histogram._cache) == CACHE_SIZE
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.ods import compute_ods, compute_expected_guesses, compute_ods_batch, compute_expected_guesses_batch
+from train.update_word_list import FACTOR_COLUMNS, FINAL_FILE, read_scores, rows_by_word
+
+
+def test_recomputed_rows_match_full_rebuild():
+    """Rows update() recomputes from their factors come out as the full build stored them."""
+    final = rows_by_word(read_scores(FINAL_FILE), FACTOR_COLUMNS + ["ODS", "ExpectedGuesses"])
+    differ = []
+    for word, row in final.items():
+        ods = compute_ods(*row[:len(FACTOR_COLUMNS)])
+        if (ods, compute_expected_guesses(ods)) != (row[-2], row[-1]):
+            differ.append(word)
+    assert differ == []
+
+
+def test_scalar_and_batch_ods_agree():
+    rng = np.random.default_rng(0)
+    factors = np.round(rng.random((6, 20_000)), 3)
+    ods = compute_ods_batch(*factors)
+    assert ods.tolist() == [compute_ods(*column) for column in factors.T.tolist()]
+    assert compute_expected_guesses_batch(ods).tolist() == [compute_expected_guesses(v) for v in ods.tolist()]
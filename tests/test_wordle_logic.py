@@ -0,0 +1,44 @@
+import os
+import sys
+from collections import Counter
+from itertools import product
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from features.wordle_logic import code_to_pattern, get_feedback, get_feedback_batch, pattern_to_code
+
+
+def reference_feedback(solution: str, guess: str) -> str:
+    """The original Counter-based two-pass scorer."""
+    feedback = ["B"] * 5
+    counter = Counter(solution)
+    for i in range(5):
+        if guess[i] == solution[i]:
+            feedback[i] = "G"
+            counter[guess[i]] -= 1
+    for i in range(5):
+        if feedback[i] == "B" and counter[guess[i]] > 0:
+            feedback[i] = "Y"
+            counter[guess[i]] -= 1
+    return "".join(feedback)
+
+
+# Every 5-letter word over a 3-letter alphabet: all duplicate-letter shapes
+WORDS = ["".join(letters) for letters in product("ABE", repeat=5)]
+
+
+def test_batch_matches_reference_for_every_pair():
+    codes = get_feedback_batch(WORDS, WORDS)
+    for g, guess in enumerate(WORDS):
+        for s, solution in enumerate(WORDS):
+            assert code_to_pattern(codes[g, s]) == reference_feedback(solution, guess), (guess, solution)
+
+
+def test_get_feedback_matches_reference():
+    for guess, solution in [("SPEED", "ABIDE"), ("ALLEY", "LLAMA"), ("EERIE", "EVERY"), ("CRANE", "CRANE")]:
+        assert get_feedback(solution, guess) == reference_feedback(solution, guess)
+
+
+def test_pattern_codes_round_trip():
+    for code in range(243):
+        assert pattern_to_code(code_to_pattern(code)) == code
@@ -0,0 +1,69 @@
+import os
+import time
+import argparse
+import warnings
+import numpy as np
+import pandas as pd
+import joblib
+
+from features.compiled_forest import CompiledForest
+from features.model_registry import WSA_MODEL_FILE, WSA_COMPILED_FILE
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+def export(model_path=WSA_MODEL_FILE, output_path=WSA_COMPILED_FILE) -> CompiledForest:
+    """Flatten the pickled random forest into the .npz node arrays."""
+    forest = CompiledForest.from_sklearn(joblib.load(model_path))
+    forest.save(output_path)
+    return forest
+
+
+def _timed(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def benchmark(model_path=WSA_MODEL_FILE, compiled_path=WSA_COMPILED_FILE, rows=10_000):
+    """Load time, single-row and batch latency of sklearn vs the compiled forest."""
+    start = time.perf_counter()
+    model = joblib.load(model_path)
+    pkl_load = time.perf_counter() - start
+    start = time.perf_counter()
+    forest = CompiledForest.load(compiled_path)
+    npz_load = time.perf_counter() - start
+
+    df = pd.read_csv(os.path.join(DATA_PATH, "wsa_training_data.csv"))
+    X = df[list(model.feature_names_in_)]
+    X = pd.concat([X] * (rows // len(X) + 1), ignore_index=True).iloc[:rows]
+    one = X.iloc[:1]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        max_diff = np.abs(model.predict(X) - forest.predict(X)).max()
+        results = {
+            "load (ms)": (pkl_load * 1000, npz_load * 1000),
+            "1 row (ms)": (_timed(lambda: model.predict(one), 50), _timed(lambda: forest.predict(one), 200)),
+            f"{rows:,} rows (ms)": (_timed(lambda: model.predict(X), 3), _timed(lambda: forest.predict(X), 3)),
+        }
+
+    print(f"{'':>16}  {'sklearn':>10}  {'compiled':>10}")
+    for name, (sk, compiled) in results.items():
+        print(f"{name:>16}  {sk:>10.2f}  {compiled:>10.2f}")
+    print(f"{'file size (MB)':>16}  {os.path.getsize(model_path) / 1e6:>10.1f}  {os.path.getsize(compiled_path) / 1e6:>10.1f}")
+    print(f"max |difference| over {rows:,} rows: {max_diff:.3g}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export wsa_regressor.pkl to array form for fast inference")
+    parser.add_argument("--benchmark", action="store_true", help="Compare load time and latency with sklearn")
+    args = parser.parse_args()
+
+    forest = export()
+    print(f"✅ Saved {len(forest.roots)} trees ({len(forest.value):,} nodes) to {WSA_COMPILED_FILE}")
+    if args.benchmark:
+        benchmark()
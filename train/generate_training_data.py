@@ -1,39 +1,119 @@
 import os
+import argparse
+import hashlib
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pandas as pd
 from tqdm import tqdm
 
-from features.shape_features import compute_shape_features
+from features.shape_features import compute_shape_features_batch
 from features.letter_features import compute_lfs, compute_plfs, compute_rlp
 from features.bigram_features import compute_hlt
+from features.corpus import corpus
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+OUTPUT_FILE = os.path.join(DATA_PATH, "wsa_training_data.csv")
+CHUNKS_DIR = os.path.join(DATA_PATH, ".training_chunks")
 
-with open(os.path.join(DATA_PATH, "words.txt")) as f:
-    all_words = [w.strip().upper() for w in f if len(w.strip()) == 5]
+all_words = corpus.words
 
 starter_words = ["STARE", "CRANE", "SLATE", "AUDIO", "RAISE", "TRACE", "ARISE", "CARTE", "SALET", "REACT", "POINT", "BLUSH", "NYMPH", "DOING", "FIGHT"]
 
-rows = []
 
-for word in tqdm(all_words, desc="Generating training data"):
-    shape_feats = compute_shape_features(word, all_words, starter_words)
+def build_rows(words: list) -> list:
+    rows = []
+    all_shape_feats = compute_shape_features_batch(words, all_words, starter_words)
+
+    for word, shape_feats in zip(words, all_shape_feats):
+        row = {
+            "Word": word,
+            "LFS": compute_lfs(word),
+            "PLFS": compute_plfs(word),
+            "RLP": compute_rlp(word),
+            "HLT": compute_hlt(word),
+            **shape_feats
+        }
+
+        rows.append(row)
+    return rows
+
+
+def chunk_path(run_dir: str, index: int) -> str:
+    return os.path.join(run_dir, f"chunk_{index:05d}.csv")
+
+
+def run_chunk(run_dir: str, index: int, words: list) -> int:
+    """Compute one chunk and write it atomically, so a finished chunk file is always complete."""
+    df = pd.DataFrame(build_rows(words))
+
+    # ✅ Drop OS only (optional: keep it for full-feature ODS)
+    if "OS" in df.columns:
+        df = df.drop(columns=["OS"])
+
+    path = chunk_path(run_dir, index)
+    df.to_csv(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+    return index
+
+
+def run_key(chunk_size: int) -> str:
+    """Checkpoints are only reused for the same word list, starters and chunking."""
+    h = hashlib.sha1()
+    h.update("\n".join(all_words).encode())
+    h.update(",".join(starter_words).encode())
+    h.update(str(chunk_size).encode())
+    return h.hexdigest()[:12]
+
+
+def generate(jobs: int = 1, chunk_size: int = 1000, resume: bool = False, keep_chunks: bool = False,
+             output_path: str = OUTPUT_FILE) -> str:
+    run_dir = os.path.join(CHUNKS_DIR, run_key(chunk_size))
+    if not resume and os.path.isdir(run_dir):
+        shutil.rmtree(run_dir)
+    os.makedirs(run_dir, exist_ok=True)
+
+    chunks = [all_words[i:i + chunk_size] for i in range(0, len(all_words), chunk_size)]
+    pending = [i for i in range(len(chunks)) if not os.path.exists(chunk_path(run_dir, i))]
+    if resume and len(pending) < len(chunks):
+        print(f"↩️ Resuming: {len(chunks) - len(pending)} of {len(chunks)} chunks already done")
+
+    progress = tqdm(total=len(chunks), initial=len(chunks) - len(pending), desc="Generating training data")
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(run_chunk, run_dir, i, chunks[i]) for i in pending]
+            for future in as_completed(futures):
+                future.result()
+                progress.update()
+    else:
+        for i in pending:
+            run_chunk(run_dir, i, chunks[i])
+            progress.update()
+    progress.close()
 
-    row = {
-        "Word": word,
-        "LFS": compute_lfs(word),
-        "PLFS": compute_plfs(word),
-        "RLP": compute_rlp(word),
-        "HLT": compute_hlt(word),
-        **shape_feats
-    }
+    # Merge in chunk order so rows follow words.txt regardless of completion order.
+    # Chunk files are concatenated as text, so values are written exactly once.
+    with open(output_path + ".tmp", "w", newline="") as out:
+        for i in range(len(chunks)):
+            with open(chunk_path(run_dir, i), newline="") as f:
+                header = f.readline()
+                if i == 0:
+                    out.write(header)
+                shutil.copyfileobj(f, out)
+    os.replace(output_path + ".tmp", output_path)
 
-    rows.append(row)
+    if not keep_chunks:
+        shutil.rmtree(run_dir)
+    return output_path
 
-df = pd.DataFrame(rows)
 
-# ✅ Drop OS only (optional: keep it for full-feature ODS)
-if "OS" in df.columns:
-    df = df.drop(columns=["OS"])
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate wsa_training_data.csv")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Words per checkpointed chunk")
+    parser.add_argument("--resume", action="store_true", help="Reuse finished chunks from an interrupted run")
+    parser.add_argument("--keep-chunks", action="store_true", help="Keep chunk files after merging")
+    args = parser.parse_args()
 
-df.to_csv(os.path.join(DATA_PATH, "wsa_training_data.csv"), index=False)
-print("✅ Saved clean wsa_training_data.csv")
+    generate(args.jobs, args.chunk_size, args.resume, args.keep_chunks)
+    print("✅ Saved clean wsa_training_data.csv")
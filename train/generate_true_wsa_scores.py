@@ -1,19 +1,15 @@
 import os
 import pandas as pd
-from tqdm import tqdm
-from features.true_wsa import compute_true_wsa
+from features.true_wsa import compute_true_wsa_batch
+from features.corpus import corpus
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
 
 # Load full word list
-with open(os.path.join(DATA_PATH, 'words.txt'), 'r') as f:
-    words = [w.strip().upper() for w in f if len(w.strip()) == 5]
+words = corpus.words
 
-# Step 1: Compute raw WSA values
-wsa_raw = []
-for word in tqdm(words, desc="Computing true WSA"):
-    avg_remaining = compute_true_wsa(word)
-    wsa_raw.append((word, avg_remaining))
+# Step 1: Compute raw WSA values (one histogram pass over all words)
+wsa_raw = list(zip(words, compute_true_wsa_batch(words, words)))
 
 # Step 2: Normalize WSA to [0, 1]
 df = pd.DataFrame(wsa_raw, columns=["Word", "RawWSA"])
@@ -1,50 +1,148 @@
 import os
+import time
+import argparse
+import tempfile
 import pandas as pd
 import joblib
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
+from features.compiled_forest import CompiledForest
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
 MODEL_PATH = os.path.join(os.path.dirname(__file__), '..', 'models')
+REPORT_FILE = os.path.join(MODEL_PATH, "wsa_sweep_report.csv")
 
-# Load training data
-df = pd.read_csv(os.path.join(DATA_PATH, "wsa_training_data.csv"))
-
-# Extract target and invert it so that higher = harder
-y_raw = df["MatchReduction"]
-y_inverted = y_raw.max() - y_raw
-
-# Drop columns safely
-drop_cols = ["Word", "MatchReduction"]
-if "OS" in df.columns:
-    drop_cols.append("OS")
-X = df.drop(columns=drop_cols)
-
-# Save training features list (optional: can be used during inference)
-features_csv = os.path.join(MODEL_PATH, "wsa_features.csv")
-pd.DataFrame(X.columns).to_csv(features_csv, index=False, header=False)
-
-# Train-test split
-X_train, X_test, y_train, y_test = train_test_split(X, y_inverted, test_size=0.2, random_state=42)
-
-# Train model
-model = RandomForestRegressor(n_estimators=200, random_state=42)
-model.fit(X_train, y_train)
-
-# Evaluate performance
-y_pred = model.predict(X_test)
-mse = mean_squared_error(y_test, y_pred)
-print(f"✅ Model trained. Test MSE: {mse:.4f}")
-
-# Save model
-joblib.dump(model, os.path.join(MODEL_PATH, "wsa_regressor.pkl"))
-print("✅ Model saved.")
-
-# Save normalization range for inference
-predicted_wsa = model.predict(X)
-wsa_min = predicted_wsa.min()
-wsa_max = predicted_wsa.max()
-with open(os.path.join(MODEL_PATH, "wsa_range.txt"), "w") as f:
-    f.write(f"{wsa_min},{wsa_max}")
-print(f"✅ Saved WSA range: ({wsa_min:.3f}, {wsa_max:.3f})")
+def load_training_data():
+    df = pd.read_csv(os.path.join(DATA_PATH, "wsa_training_data.csv"))
+
+    # Extract target and invert it so that higher = harder
+    y_raw = df["MatchReduction"]
+    y_inverted = y_raw.max() - y_raw
+
+    # Drop columns safely
+    drop_cols = ["Word", "MatchReduction"]
+    if "OS" in df.columns:
+        drop_cols.append("OS")
+    X = df.drop(columns=drop_cols)
+
+    # Save training features list (optional: can be used during inference)
+    features_csv = os.path.join(MODEL_PATH, "wsa_features.csv")
+    pd.DataFrame(X.columns).to_csv(features_csv, index=False, header=False)
+    return X, y_inverted
+
+def save_model(model, X):
+    # Save model, plus the array-compiled copy used for fast inference
+    joblib.dump(model, os.path.join(MODEL_PATH, "wsa_regressor.pkl"))
+    compiled_path = os.path.join(MODEL_PATH, "wsa_regressor.npz")
+    if isinstance(model, RandomForestRegressor):
+        CompiledForest.from_sklearn(model).save(compiled_path)
+    elif os.path.exists(compiled_path):
+        os.remove(compiled_path)  # a stale forest would shadow the new model
+    print("✅ Model saved.")
+
+    # Save normalization range for inference
+    predicted_wsa = model.predict(X)
+    wsa_min = predicted_wsa.min()
+    wsa_max = predicted_wsa.max()
+    with open(os.path.join(MODEL_PATH, "wsa_range.txt"), "w") as f:
+        f.write(f"{wsa_min},{wsa_max}")
+    print(f"✅ Saved WSA range: ({wsa_min:.3f}, {wsa_max:.3f})")
+
+def sweep_candidates(jobs):
+    """(name, unfitted model) pairs: forests by size and depth, plus gradient boosting."""
+    for n_estimators in [25, 50, 100, 200]:
+        for max_depth in [8, 12, 16, None]:
+            yield (f"rf_{n_estimators}_d{max_depth or 'max'}",
+                   RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth,
+                                         random_state=42, n_jobs=jobs))
+    # Boosting stops early on a validation split, so only the step size and tree size vary
+    for learning_rate in [0.1, 0.05]:
+        for max_leaf_nodes in [15, 31, 63]:
+            yield (f"hgb_lr{learning_rate}_l{max_leaf_nodes}",
+                   HistGradientBoostingRegressor(learning_rate=learning_rate, max_iter=500,
+                                                 max_leaf_nodes=max_leaf_nodes, random_state=42))
+
+def _latency_ms(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def evaluate(name, model, X_train, X_test, y_train, y_test, workdir) -> dict:
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+    mse = mean_squared_error(y_test, model.predict(X_test))
+
+    path = os.path.join(workdir, f"{name}.pkl")
+    joblib.dump(model, path)
+    start = time.perf_counter()
+    joblib.load(path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "MSE": mse,
+        "FitSeconds": round(fit_seconds, 3),
+        "FileMB": round(os.path.getsize(path) / 1e6, 3),
+        "LoadMs": round(load_ms, 3),
+        "SingleRowMs": round(_latency_ms(lambda: model.predict(X_test.iloc[:1]), 20), 3),
+        "BatchMs": round(_latency_ms(lambda: model.predict(X_test), 3), 3),
+    }
+
+def sweep(X, y, jobs=1, tolerance=0.05, report_path=REPORT_FILE):
+    """
+    Train every candidate, write the report CSV, and save the smallest model
+    whose test MSE is within `tolerance` (relative) of the best one.
+    """
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    rows = []
+    # Candidates are kept on disk rather than in memory until one is chosen
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, model in sweep_candidates(jobs):
+            row = {"Model": name, **evaluate(name, model, X_train, X_test, y_train, y_test, workdir)}
+            print(f"   {name:>14}: MSE {row['MSE']:.4f}, {row['FileMB']:.1f} MB, "
+                  f"load {row['LoadMs']:.0f} ms, 1 row {row['SingleRowMs']:.1f} ms")
+            rows.append(row)
+            del model
+
+        report = pd.DataFrame(rows)
+        best_mse = report["MSE"].min()
+        report["WithinTolerance"] = report["MSE"] <= best_mse * (1 + tolerance)
+        chosen = report[report["WithinTolerance"]].sort_values(["FileMB", "MSE"]).iloc[0]
+        report["Selected"] = report["Model"] == chosen["Model"]
+        report.to_csv(report_path, index=False)
+        print(f"✅ Saved sweep report to {report_path}")
+        print(f"✅ Selected {chosen['Model']}: MSE {chosen['MSE']:.4f} (best {best_mse:.4f}), {chosen['FileMB']:.1f} MB")
+
+        save_model(joblib.load(os.path.join(workdir, f"{chosen['Model']}.pkl")), X)
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the WSA regressor")
+    parser.add_argument("--jobs", type=int, default=1, help="Cores used to fit forests (-1 for all)")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Try forest sizes/depths and gradient boosting, report, and keep the smallest good one")
+    parser.add_argument("--tolerance", type=float, default=0.05,
+                        help="Sweep: allowed relative MSE above the best candidate (default: 0.05)")
+    args = parser.parse_args()
+
+    X, y_inverted = load_training_data()
+
+    if args.sweep:
+        sweep(X, y_inverted, args.jobs, args.tolerance)
+    else:
+        # Train-test split
+        X_train, X_test, y_train, y_test = train_test_split(X, y_inverted, test_size=0.2, random_state=42)
+
+        # Train model
+        model = RandomForestRegressor(n_estimators=200, random_state=42, n_jobs=args.jobs)
+        model.fit(X_train, y_train)
+
+        # Evaluate performance
+        y_pred = model.predict(X_test)
+        mse = mean_squared_error(y_test, y_pred)
+        print(f"✅ Model trained. Test MSE: {mse:.4f}")
+
+        save_model(model, X)
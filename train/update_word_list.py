@@ -0,0 +1,171 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+from features.pattern_histogram import StarterHistograms
+from features.true_wsa import STARTERS as WSA_STARTERS, true_wsa_from_histograms
+from features.shape_features import shape_features_from_histograms
+from features.letter_features import compute_lfs, compute_plfs, compute_rlp
+from features.bigram_features import compute_hlt
+from features.ods import compute_ods, compute_expected_guesses
+from features.obscurity_score import compute_os
+from features.corpus import corpus
+from train.generate_training_data import starter_words as TRAINING_STARTERS
+from app.build_difficulty_store import build_difficulty_store
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data')
+MANIFEST_FILE = os.path.join(DATA_PATH, "words_manifest.npz")
+TRUE_WSA_FILE = os.path.join(DATA_PATH, "true_wsa_scores.csv")
+TRAINING_FILE = os.path.join(DATA_PATH, "wsa_training_data.csv")
+FINAL_FILE = os.path.join(DATA_PATH, "final_difficulty_scores.csv")
+
+SHAPE_COLUMNS = ["MatchReduction", "AvgElimination", "FeedbackGreen", "FeedbackYellow", "FeedbackGray"]
+FACTOR_COLUMNS = ["LFS", "PLFS", "RLP", "HLT", "WSA", "OS"]
+
+
+def read_scores(path):
+    # round_trip keeps the stored 3-decimal values bit-exact when rewritten
+    return pd.read_csv(path, float_precision="round_trip")
+
+
+def rows_by_word(df, columns):
+    return dict(zip(df["Word"], df[columns].values.tolist()))
+
+
+def save_manifest(words, wsa_counts, training_counts, path=MANIFEST_FILE):
+    np.savez(
+        path,
+        words=np.array(words),
+        wsa_starters=np.array(WSA_STARTERS),
+        wsa_counts=wsa_counts,
+        training_starters=np.array(TRAINING_STARTERS),
+        training_counts=training_counts,
+    )
+
+
+def init_manifest(path=MANIFEST_FILE):
+    """Record the word list the current score CSVs were built from."""
+    words = read_scores(TRUE_WSA_FILE)["Word"].tolist()
+    wsa_counts = StarterHistograms(WSA_STARTERS, words).counts
+    training_counts = StarterHistograms(TRAINING_STARTERS, words).counts
+    save_manifest(words, wsa_counts, training_counts, path)
+    return words
+
+
+def update_histograms(starters, old_words, counts, new_words, added, removed):
+    """
+    Shift the stored histograms by the added/removed words' pattern buckets.
+    Returns the new histograms and a mask of kept words whose bucket changed.
+    """
+    old = StarterHistograms(starters, old_words, counts)
+    delta = old.bucket_counts(added) - old.bucket_counts(removed)
+    new = StarterHistograms(starters, new_words, counts + delta)
+
+    removed_set = set(removed)
+    kept = [w for w in old_words if w not in removed_set]
+    kept_codes = new.word_codes(kept).astype(np.intp)
+    changed = (np.take_along_axis(delta, kept_codes, axis=1) != 0).any(axis=0)
+    return new, {w for w, c in zip(kept, changed) if c}
+
+
+def new_word_os(words):
+    """OS for words without a stored score; unknown frequency means fully obscure."""
+    try:
+        return {w: compute_os(w) for w in words}
+    except FileNotFoundError:
+        return {w: 1.0 for w in words}
+
+
+def update(manifest_path=MANIFEST_FILE):
+    manifest = np.load(manifest_path)
+    if list(manifest["wsa_starters"]) != WSA_STARTERS or list(manifest["training_starters"]) != TRAINING_STARTERS:
+        raise ValueError("Starter words changed since the manifest was written; regenerate from scratch.")
+
+    old_words = manifest["words"].tolist()
+    new_words = corpus.words
+    old_set, new_set = set(old_words), set(new_words)
+    added = [w for w in new_words if w not in old_set]
+    removed = [w for w in old_words if w not in new_set]
+    if not added and not removed:
+        print("✅ words.txt unchanged, nothing to update")
+        return
+
+    wsa_hist, wsa_changed = update_histograms(
+        WSA_STARTERS, old_words, manifest["wsa_counts"], new_words, added, removed)
+    training_hist, training_changed = update_histograms(
+        TRAINING_STARTERS, old_words, manifest["training_counts"], new_words, added, removed)
+    if len(new_words) != len(old_words):
+        # Eliminations are relative to the dictionary size, so every shape row moves
+        training_changed = new_set
+    print(f"➕ {len(added)} added, ➖ {len(removed)} removed, "
+          f"🔁 {len(wsa_changed)} WSA / {len(training_changed)} shape rows affected")
+
+    # true_wsa_scores.csv: recompute affected raw WSA, refresh min/max normalization
+    true_wsa = read_scores(TRUE_WSA_FILE)
+    recompute = [w for w in new_words if w not in old_set or w in wsa_changed]
+    raw = dict(zip(true_wsa["Word"], true_wsa["RawWSA"]))
+    raw.update(zip(recompute, true_wsa_from_histograms(wsa_hist, recompute)))
+    wsa_df = pd.DataFrame({"Word": new_words, "RawWSA": [raw[w] for w in new_words]})
+    min_val = wsa_df["RawWSA"].min()
+    max_val = wsa_df["RawWSA"].max()
+    wsa_df["WSA"] = wsa_df["RawWSA"].apply(lambda x: round((x - min_val) / (max_val - min_val), 3))
+
+    # wsa_training_data.csv: shape features for affected rows only. Letter and
+    # bigram scores are relative to the whole dictionary, so every row is
+    # refreshed (they are table lookups).
+    training = read_scores(TRAINING_FILE)
+    recompute = [w for w in new_words if w not in old_set or w in training_changed]
+    shape = rows_by_word(training, SHAPE_COLUMNS)
+    for w, feats in zip(recompute, shape_features_from_histograms(training_hist, recompute)):
+        shape[w] = [feats[c] for c in SHAPE_COLUMNS]
+    training_df = pd.DataFrame({
+        "Word": new_words,
+        "LFS": [compute_lfs(w) for w in new_words],
+        "PLFS": [compute_plfs(w) for w in new_words],
+        "RLP": [compute_rlp(w) for w in new_words],
+        "HLT": [compute_hlt(w) for w in new_words],
+    })
+    training_df[SHAPE_COLUMNS] = pd.DataFrame([shape[w] for w in new_words], columns=SHAPE_COLUMNS)
+
+    # final_difficulty_scores.csv: ODS is only recomputed where a factor moved
+    final = rows_by_word(read_scores(FINAL_FILE), FACTOR_COLUMNS + ["ODS", "ExpectedGuesses"])
+    os_scores = {w: row[FACTOR_COLUMNS.index("OS")] for w, row in final.items()}
+    os_scores.update(new_word_os(added))
+    factors = training_df[["Word", "LFS", "PLFS", "RLP", "HLT"]].copy()
+    factors["WSA"] = wsa_df["WSA"].values
+    factors["OS"] = [os_scores[w] for w in new_words]
+    ods, expected = [], []
+    for row in factors.itertuples(index=False):
+        values = [getattr(row, c) for c in FACTOR_COLUMNS]
+        stored = final.get(row.Word)
+        if stored is not None and values == stored[:len(FACTOR_COLUMNS)]:
+            ods.append(stored[-2])
+            expected.append(stored[-1])
+        else:
+            ods.append(compute_ods(*values))
+            expected.append(compute_expected_guesses(ods[-1]))
+    factors["ODS"] = ods
+    factors["ExpectedGuesses"] = expected
+
+    wsa_df.to_csv(TRUE_WSA_FILE, index=False)
+    training_df.to_csv(TRAINING_FILE, index=False)
+    factors.to_csv(FINAL_FILE, index=False)
+    build_difficulty_store(FINAL_FILE)
+    save_manifest(new_words, wsa_hist.counts, training_hist.counts, manifest_path)
+    print(f"✅ Updated {len(new_words)} rows in true_wsa_scores.csv, wsa_training_data.csv, final_difficulty_scores.csv")
+    print("✅ Rebuilt the packed difficulty store")
+    print(f"⚙️ WSA min: {min_val}, max: {max_val}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally update score CSVs after words.txt changes")
+    parser.add_argument("--init", action="store_true",
+                        help="Record the word list of the current CSVs as the baseline manifest")
+    args = parser.parse_args()
+
+    if args.init or not os.path.exists(MANIFEST_FILE):
+        words = init_manifest()
+        print(f"✅ Saved manifest for {len(words)} words to {MANIFEST_FILE}")
+    if not args.init:
+        update()